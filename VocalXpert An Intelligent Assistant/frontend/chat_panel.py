@@ -4,7 +4,11 @@ Chat Panel - Main conversation interface
 The primary chat interface with message history, input, and quick actions.
 """
 
-from modules.ai_chat import SYSTEM_PROMPT
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,8 +19,7 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QSpacerItem,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 
 from .components import (
     Card,
@@ -25,14 +28,41 @@ from .components import (
     StatusBar,
     QuickActionButton,
     SectionHeader,
+    apply_gpu_viewport,
+)
+from .themes import FONTS, SPACING, get_font
+
+# Messages kept mounted on each side of the visible ones
+_WINDOW_MARGIN = 15
+# Upper bound on mounted bubbles when the viewport cannot be measured
+_WINDOW_SIZE = 50
+# Messages mounted per step while scrolling through history
+_HYDRATE_BATCH = 15
+# (icon, label, command) for the buttons above the input field
+_QUICK_ACTIONS = (
+    ("⏰", "Time", "what time is it"),
+    ("🌤️", "Weather", "what's the weather"),
+    ("📰", "News", "latest news"),
+    ("🎲", "Dice", "roll a dice"),
+    ("🎮", "RPS", "play rock paper scissors"),
 )
-from .themes import FONTS, SPACING, get_theme
+# Auto-scroll only while the view is within this many pixels of the bottom
+_STICK_TO_BOTTOM_PX = 200
+
+
+@lru_cache(maxsize=8)
+def _truncate_prompt(prompt: str, limit: int = 500) -> str:
+    """Shorten the system prompt for display."""
+    return prompt[:limit] + "..." if len(prompt) > limit else prompt
 
-# Import system prompt from ai_chat module
-import sys
-import os
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+@dataclass
+class MessageData:
+    """Raw chat message; bubbles are only built for the visible window."""
+
+    text: str
+    is_user: bool = False
+    timestamp: float = field(default_factory=time.time)
 
 
 class ChatPanel(QWidget):
@@ -44,10 +74,35 @@ class ChatPanel(QWidget):
     voice_clicked = Signal()
     quick_action = Signal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, system_prompt: Optional[str] = None):
         super().__init__(parent)
+        self._system_prompt = system_prompt
+        self._store: List[MessageData] = []
+        self._mounted: Dict[int, QWidget] = {}
+        # Unmounted bubbles kept for reuse instead of being recreated
+        self._bubble_pool: List[MessageBubble] = []
+        # Message being streamed into; never pruned or recycled
+        self._active_index: Optional[int] = None
+        # (message index, offset from viewport top) restored after relayout
+        self._anchor = None
+        self._prune_pending = False
+        # Whether the view follows new messages at the bottom
+        self._pinned = True
+
+        # Coalesces the scroll requests of a burst of messages into one
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._scroll_to_bottom)
+
+        # Streamed text per message index, applied once per frame
+        self._pending_chunks: Dict[int, str] = {}
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.setInterval(16)
+        self._stream_timer.timeout.connect(self._flush_stream)
+
         self._setup_ui()
-        self._messages = []
 
     def _setup_ui(self):
         """Build the chat interface."""
@@ -78,13 +133,7 @@ class ChatPanel(QWidget):
     def _create_header(self) -> QWidget:
         """Create the chat header."""
         header = QFrame()
-        theme = get_theme()
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.bg_secondary};
-                border-bottom: 1px solid {theme.border};
-            }}
-        """)
+        header.setObjectName("chatHeader")
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(SPACING["xl"], SPACING["md"], SPACING["xl"],
@@ -92,8 +141,7 @@ class ChatPanel(QWidget):
 
         # Title
         title = QLabel("💬 Chat")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_xl"], FONTS["weight_bold"]))
 
         # Subtitle
         subtitle = QLabel("Ask me anything!")
@@ -115,6 +163,7 @@ class ChatPanel(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setFrameShape(QFrame.NoFrame)
+        apply_gpu_viewport(scroll)
 
         # Message container
         self.message_container = QWidget()
@@ -127,6 +176,10 @@ class ChatPanel(QWidget):
         scroll.setWidget(self.message_container)
         self.scroll_area = scroll
 
+        scrollbar = scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._check_hydration_needed)
+        scrollbar.rangeChanged.connect(self._on_range_changed)
+
         # Add welcome message
         self._add_system_prompt()
 
@@ -141,25 +194,24 @@ class ChatPanel(QWidget):
 
         # System prompt icon
         icon = QLabel("🤖")
-        icon.setFont(QFont(FONTS["family"], 48))
+        icon.setFont(get_font(48))
         icon.setAlignment(Qt.AlignCenter)
 
         # System prompt title
         title = QLabel("System Prompt")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_2xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_2xl"], FONTS["weight_bold"]))
         title.setAlignment(Qt.AlignCenter)
 
+        system_prompt = self._system_prompt
+        if system_prompt is None:
+            # Imported here so loading the UI doesn't pull in the AI backend
+            from modules.ai_chat import SYSTEM_PROMPT as system_prompt
+
         # System prompt text (truncated for display)
-        prompt_text = (SYSTEM_PROMPT[:500] +
-                       "..." if len(SYSTEM_PROMPT) > 500 else SYSTEM_PROMPT)
-        text = QLabel(prompt_text)
-        text.setProperty("class", "muted")
+        text = QLabel(_truncate_prompt(system_prompt))
+        text.setProperty("class", "system-prompt")
         text.setAlignment(Qt.AlignLeft)
         text.setWordWrap(True)
-        text.setStyleSheet(
-            "font-family: 'Consolas', monospace; font-size: 10px; line-height: 1.4;"
-        )
 
         prompt_layout.addWidget(icon)
         prompt_layout.addWidget(title)
@@ -174,50 +226,32 @@ class ChatPanel(QWidget):
     def _create_quick_actions(self) -> QWidget:
         """Create quick action buttons."""
         container = QWidget()
-        theme = get_theme()
-        container.setStyleSheet(f"background-color: {theme.bg_primary};")
+        container.setObjectName("quickActions")
 
         layout = QHBoxLayout(container)
         layout.setContentsMargins(SPACING["xl"], SPACING["sm"], SPACING["xl"],
                                   SPACING["sm"])
         layout.setSpacing(SPACING["sm"])
 
-        actions = [
-            ("⏰", "Time", "what time is it"),
-            ("🌤️", "Weather", "what's the weather"),
-            ("📰", "News", "latest news"),
-            ("🎲", "Dice", "roll a dice"),
-            ("🎮", "RPS", "play rock paper scissors"),
-        ]
-
-        for icon, text, command in actions:
+        for icon, text, command in _QUICK_ACTIONS:
             btn = QuickActionButton(icon, text)
-            # Use a helper to create proper handler
-            btn.clicked.connect(self._make_quick_action_handler(command))
+            btn.setProperty("command", command)
+            btn.clicked.connect(self._on_quick_action)
             layout.addWidget(btn)
 
         layout.addStretch()
 
         return container
 
-    def _make_quick_action_handler(self, command: str):
-        """Create handler for quick action button."""
-
-        def handler():
-            self.quick_action.emit(command)
-
-        return handler
+    @Slot()
+    def _on_quick_action(self):
+        """Emit the command of the quick action button that was clicked."""
+        self.quick_action.emit(self.sender().property("command"))
 
     def _create_input_area(self) -> QWidget:
         """Create the message input area."""
         container = QWidget()
-        theme = get_theme()
-        container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {theme.bg_secondary};
-                border-top: 1px solid {theme.border};
-            }}
-        """)
+        container.setObjectName("inputArea")
 
         layout = QHBoxLayout(container)
         layout.setContentsMargins(SPACING["xl"], SPACING["md"], SPACING["xl"],
@@ -231,54 +265,261 @@ class ChatPanel(QWidget):
 
         return container
 
-    def add_message(self, text: str, is_user: bool = False):
-        """Add a message to the chat."""
-        # Hide welcome card after first real message
-        if hasattr(self, "welcome_card") and self.welcome_card.isVisible():
-            self.welcome_card.hide()
-
-        # Create message bubble
-        bubble = MessageBubble(text, is_user)
-
-        # Create container for alignment
-        container = QWidget()
-        container_layout = QHBoxLayout(container)
-        container_layout.setContentsMargins(0, 0, 0, 0)
-
-        if is_user:
-            container_layout.addStretch()
-            container_layout.addWidget(bubble)
+    @Slot(str, bool)
+    def add_message(self, text: str, is_user: bool = False) -> int:
+        """Add a message to the chat and return its index."""
+        index, follow = self._append_message(text, is_user)
+        self._prune_old_messages(keep_anchor=not follow)
+
+        if follow and not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+        return index
+
+    def add_messages(self, items: List[Tuple[str, bool]]):
+        """Add several (text, is_user) messages with a single repaint."""
+        if not items:
+            return
+        follow = False
+        self.message_container.setUpdatesEnabled(False)
+        try:
+            for text, is_user in items:
+                _, followed = self._append_message(text, is_user)
+                follow = follow or followed
+            self._prune_old_messages(keep_anchor=not follow)
+        finally:
+            self.message_container.setUpdatesEnabled(True)
+
+        if follow and not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    def _append_message(self, text: str, is_user: bool) -> Tuple[int, bool]:
+        """Store a message and return its index and whether to follow it."""
+        self._store.append(MessageData(text, is_user))
+        index = len(self._store) - 1
+
+        # Follow the conversation only if the user hasn't scrolled away,
+        # except for their own messages which always bring them back
+        follow = is_user or self._pinned
+
+        _, last = self._window()
+        if last == index - 1:
+            self._mount(index)
+        elif follow:
+            # Jump back to the tail from older history
+            self._unmount_all()
+            for i in range(max(0, index - _WINDOW_SIZE), index + 1):
+                self._mount(i)
+        # Otherwise it is hydrated once the user scrolls down to it
+        return index, follow
+
+    @Slot(int, str)
+    def append_to_message(self, index: int, chunk: str):
+        """Append streamed text to a message, refreshing it once per frame."""
+        pending = self._pending_chunks.get(index, "")
+        self._pending_chunks[index] = pending + chunk
+        if not self._stream_timer.isActive():
+            self._stream_timer.start()
+
+    @Slot()
+    def _flush_stream(self):
+        """Apply the text accumulated since the last frame."""
+        for index, text in self._pending_chunks.items():
+            # The message may have been cleared while text was pending
+            if index >= len(self._store):
+                continue
+            message = self._store[index]
+            message.text += text
+            widget = self._mounted.get(index)
+            if widget is not None:
+                widget.set_text(message.text)
+        self._pending_chunks.clear()
+        if self._pinned and not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    @Slot(int)
+    def set_active_message(self, index: Optional[int]):
+        """Pin the message being streamed so pruning never unmounts it."""
+        self._active_index = index
+
+    def _create_message_widget(self, message: MessageData) -> QWidget:
+        """Get a bubble for a stored message, reusing a pooled one if any."""
+        if not self._bubble_pool:
+            return MessageBubble(message.text, message.is_user)
+        bubble = self._bubble_pool.pop()
+        bubble.set_text(message.text)
+        bubble.set_role(message.is_user)
+        return bubble
+
+    def _window(self):
+        """Return the (first, last) indexes of the mounted range."""
+        keys = [i for i in self._mounted if i != self._active_index]
+        if not keys:
+            keys = list(self._mounted)
+        if not keys:
+            return 0, -1
+        return min(keys), max(keys)
+
+    def _mount(self, index: int):
+        """Materialize the widget for a stored message in layout order."""
+        if index in self._mounted:
+            return
+        later = [i for i in self._mounted if i > index]
+        if later:
+            position = self.message_layout.indexOf(self._mounted[min(later)])
+        else:
+            # Insert before the stretch
+            position = self.message_layout.count() - 1
+        message = self._store[index]
+        widget = self._create_message_widget(message)
+        # Align the bubble itself instead of wrapping it in a stretch row
+        self.message_layout.insertWidget(
+            position, widget, 0,
+            Qt.AlignRight if message.is_user else Qt.AlignLeft)
+        self._mounted[index] = widget
+
+    def _unmount(self, index: int):
+        """Drop the widget for a message; its data stays in the store."""
+        widget = self._mounted.pop(index)
+        self.message_layout.removeWidget(widget)
+        if len(self._bubble_pool) < _WINDOW_SIZE:
+            # Unparenting hides the bubble without marking it explicitly
+            # hidden, so the layout shows it again once it is reinserted
+            widget.setParent(None)
+            self._bubble_pool.append(widget)
+        else:
+            widget.deleteLater()
+
+    def _unmount_all(self):
+        self.message_container.setUpdatesEnabled(False)
+        try:
+            for index in list(self._mounted):
+                if index != self._active_index:
+                    self._unmount(index)
+        finally:
+            self.message_container.setUpdatesEnabled(True)
+
+    def _visible_range(self):
+        """Return the (first, last) mounted indexes inside the viewport."""
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + self.scroll_area.viewport().height()
+        visible = [
+            i for i, w in self._mounted.items()
+            if w.isVisible() and w.y() < bottom and w.y() + w.height() > top
+        ]
+        if not visible:
+            return None
+        return min(visible), max(visible)
+
+    def _capture_anchor(self):
+        """Remember the first visible message and its offset on screen."""
+        if self._anchor is not None:
+            return
+        top = self.scroll_area.verticalScrollBar().value()
+        for index in sorted(self._mounted):
+            widget = self._mounted[index]
+            if widget.isVisible() and widget.y() + widget.height() > top:
+                self._anchor = (index, widget.y() - top)
+                return
+
+    @Slot()
+    def _apply_anchor(self):
+        """Restore the anchored message position once the layout settles."""
+        if self._anchor is not None:
+            index, offset = self._anchor
+            self._anchor = None
+            widget = self._mounted.get(index)
+            if widget is not None:
+                self.scroll_area.verticalScrollBar().setValue(widget.y() -
+                                                              offset)
+        if self._prune_pending:
+            self._prune_old_messages()
+
+    def _prune_old_messages(self, keep_anchor: bool = True):
+        """Unmount widgets that are far outside the viewport."""
+        self._prune_pending = False
+        visible = self._visible_range()
+        if visible is None:
+            low, high = len(self._store) - _WINDOW_SIZE, len(self._store) - 1
         else:
-            container_layout.addWidget(bubble)
-            container_layout.addStretch()
+            low = visible[0] - _WINDOW_MARGIN
+            high = visible[1] + _WINDOW_MARGIN
 
-        # Insert before the stretch
-        self.message_layout.insertWidget(self.message_layout.count() - 1,
-                                         container)
-        self._messages.append(container)
+        stale = [
+            i for i in self._mounted
+            if (i < low or i > high) and i != self._active_index
+        ]
+        if not stale:
+            return
+        if keep_anchor:
+            self._capture_anchor()
+        for index in stale:
+            self._unmount(index)
+        if self._anchor is not None:
+            # The range may stay the same, so don't rely on rangeChanged
+            QTimer.singleShot(0, self, self._apply_anchor)
+
+    @Slot(int, int)
+    def _on_range_changed(self, minimum: int, maximum: int):
+        """Keep the view steady, or at the bottom, as the content resizes."""
+        if self._anchor is not None or self._prune_pending:
+            self._apply_anchor()
+        elif self._pinned:
+            self.scroll_area.verticalScrollBar().setValue(maximum)
+
+    @Slot(int)
+    def _check_hydration_needed(self, value: int):
+        """Mount stored messages as the user scrolls towards either end."""
+        scrollbar = self.scroll_area.verticalScrollBar()
+        if self._anchor is None:
+            self._pinned = (value >=
+                            scrollbar.maximum() - _STICK_TO_BOTTOM_PX)
+        if self._anchor is not None or not self._store:
+            return
+        threshold = self.scroll_area.viewport().height()
+        first, last = self._window()
+
+        if value <= threshold and first > 0:
+            indexes = range(max(0, first - _HYDRATE_BATCH), first)
+        elif (value >= scrollbar.maximum() - threshold
+              and last < len(self._store) - 1):
+            indexes = range(last + 1,
+                            min(len(self._store), last + 1 + _HYDRATE_BATCH))
+        else:
+            return
 
-        # Scroll to bottom
-        QTimer.singleShot(50, self._scroll_to_bottom)
+        self._capture_anchor()
+        for index in indexes:
+            self._mount(index)
+        self._prune_pending = True
+        QTimer.singleShot(0, self, self._apply_anchor)
 
+    @Slot()
     def _scroll_to_bottom(self):
         """Scroll chat to the bottom."""
+        self._pinned = True
         scrollbar = self.scroll_area.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    @Slot(str, str)
     def set_status(self, status: str, text: str = None):
         """Update the status bar."""
         self.status_bar.set_status(status, text)
 
+    @Slot(bool)
     def set_voice_active(self, active: bool):
         """Toggle voice button state."""
         self.chat_input.set_voice_active(active)
 
+    @Slot()
     def clear_chat(self):
         """Clear all messages."""
-        for msg in self._messages:
-            msg.deleteLater()
-        self._messages.clear()
-
-        # Show welcome card again
-        if hasattr(self, "welcome_card"):
-            self.welcome_card.show()
+        # Release the streamed message so it is unmounted with the rest
+        self._active_index = None
+        self._unmount_all()
+        self._store.clear()
+        self._anchor = None
+        self._prune_pending = False
+        self._pinned = True
+        self._scroll_timer.stop()
+        self._pending_chunks.clear()
+        self._stream_timer.stop()
@@ -4,6 +4,10 @@ Custom UI Components for VocalXpert
 Reusable, styled widgets for the modern UI.
 """
 
+import os
+from functools import lru_cache
+from typing import Tuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,11 +19,71 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QLineEdit,
     QTextEdit,
+    QMenu,
+)
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    Slot,
+    QSize,
+    QRect,
+    QRectF,
+    QEvent,
+    QPropertyAnimation,
+    QEasingCurve,
+    Property,
+)
+from PySide6.QtGui import (
+    QFont,
+    QFontMetrics,
+    QBrush,
+    QColor,
+    QIcon,
+    QPixmap,
+    QPainter,
+    QPainterPath,
+    QStaticText,
+    QTransform,
+    QGuiApplication,
 )
-from PySide6.QtCore import Qt, Signal, QSize, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QFont, QColor, QIcon, QPixmap, QPainter, QPainterPath
 
-from .themes import FONTS, RADIUS, SPACING, get_theme
+from .themes import FONTS, RADIUS, SPACING, get_font, get_theme, theme_version
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+    OPENGL_AVAILABLE = True
+except ImportError:
+    OPENGL_AVAILABLE = False
+
+
+@lru_cache(maxsize=4096)
+def _measure_text(font_key: str, text: str,
+                  wrap_width: int) -> Tuple[int, int]:
+    font = QFont()
+    font.fromString(font_key)
+    rect = QFontMetrics(font).boundingRect(QRect(0, 0, wrap_width, 1 << 20),
+                                           Qt.TextWordWrap, text)
+    return rect.width(), rect.height()
+
+
+def measure_text(font: QFont, text: str, wrap_width: int) -> QSize:
+    """Size of ``text`` word-wrapped at ``wrap_width``, memoized per font."""
+    return QSize(*_measure_text(font.toString(), text, wrap_width))
+
+
+def apply_gpu_viewport(scroll: QScrollArea) -> bool:
+    """Render a scroll area through an OpenGL viewport when enabled.
+
+    Opt-in with VOCALXPERT_OPENGL=true, since QOpenGLWidget needs working
+    GL drivers. Returns whether the viewport was replaced.
+    """
+    if not OPENGL_AVAILABLE:
+        return False
+    if os.environ.get("VOCALXPERT_OPENGL", "").lower() != "true":
+        return False
+    scroll.setViewport(QOpenGLWidget())
+    return True
 
 
 class Card(QWidget):
@@ -76,7 +140,7 @@ class IconButton(QPushButton):
         self.setText(icon_text)
         self.setFixedSize(size, size)
         self.setCursor(Qt.PointingHandCursor)
-        self.setFont(QFont(FONTS["family"], size // 2))
+        self.setFont(get_font(size // 2))
 
 
 class NavButton(QPushButton):
@@ -93,43 +157,153 @@ class NavButton(QPushButton):
 
     def set_active(self, active: bool):
         """Set the active state."""
-        self.setProperty("active", "true" if active else "false")
-        self.style().unpolish(self)
+        value = "true" if active else "false"
+        if self.property("active") == value:
+            return
+        self.setProperty("active", value)
+        # Re-evaluates the [active="true"] rule; polish drops the cached
+        # rules itself, so no unpolish pass is needed
         self.style().polish(self)
         self.update()
 
 
-class MessageBubble(QFrame):
+class MessageBubble(QWidget):
     """
     A chat message bubble with proper styling for user/bot messages.
+
+    The bubble paints its own background and text instead of hosting a
+    layout and a QLabel, so each message costs a single widget.
     """
 
+    MAX_WIDTH = 500
+
     def __init__(self, text: str, is_user: bool = False, parent=None):
         super().__init__(parent)
 
-        self.setProperty("class", "message-user" if is_user else "message-bot")
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(SPACING["md"], SPACING["sm"], SPACING["md"],
-                                  SPACING["sm"])
-
-        # Message text
-        self.label = QLabel(text)
-        self.label.setWordWrap(True)
-        self.label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self._text = text
+        self._is_user = is_user
+        self._padding = (SPACING["md"], SPACING["sm"])
+        # Keeps the laid-out glyphs so repaints don't reshape the text
+        self._static = QStaticText(text)
+        self._static.setTextFormat(Qt.PlainText)
+        self._font_key = self.font().toString()
+        self._path = QPainterPath()
+        self._path_size = QSize()
+        self._apply_role_colors()
+
+        policy = QSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+        self.setMaximumWidth(self.MAX_WIDTH)
+
+    def text(self) -> str:
+        return self._text
+
+    def is_user(self) -> bool:
+        return self._is_user
+
+    def set_role(self, is_user: bool):
+        """Switch between user and bot styling, e.g. when reusing a bubble."""
+        if is_user == self._is_user:
+            return
+        self._is_user = is_user
+        self._apply_role_colors()
+        # The tight corner moves to the other side
+        self._path_size = QSize()
+        self.update()
 
+    def _apply_role_colors(self):
         theme = get_theme()
-        if is_user:
-            self.label.setStyleSheet(
-                f"color: {theme.chat_user_text}; background: transparent;")
+        self._theme_version = theme_version()
+        if self._is_user:
+            self._bg = QColor(theme.chat_user_bg)
+            self._fg = QColor(theme.chat_user_text)
         else:
-            self.label.setStyleSheet(
-                f"color: {theme.chat_bot_text}; background: transparent;")
+            self._bg = QColor(theme.chat_bot_bg)
+            self._fg = QColor(theme.chat_bot_text)
+
+    def set_text(self, text: str):
+        """Replace the message text, e.g. while a reply is streamed in."""
+        if text == self._text:
+            return
+        self._text = text
+        self._static.setText(text)
+        # Re-laid out at the current width on the next paint
+        self._static.setTextWidth(-1)
+        self.updateGeometry()
+        self.update()
+
+    def contextMenuEvent(self, event):
+        # Painted text can't be selected, so offer copying the whole message
+        menu = QMenu(self)
+        menu.addAction("Copy", self._copy_text)
+        menu.exec(event.globalPos())
+
+    @Slot()
+    def _copy_text(self):
+        QGuiApplication.clipboard().setText(self._text)
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        pad_x, pad_y = self._padding
+        text_width = max(1, min(width, self.MAX_WIDTH) - 2 * pad_x)
+        _, height = _measure_text(self._font_key, self._text, text_width)
+        return height + 2 * pad_y
+
+    def sizeHint(self) -> QSize:
+        pad_x, _ = self._padding
+        natural, _ = _measure_text(self._font_key, self._text,
+                                   self.MAX_WIDTH - 2 * pad_x)
+        width = min(self.MAX_WIDTH, natural + 2 * pad_x + 1)
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(2 * self._padding[0], self.heightForWidth(
+            self.MAX_WIDTH))
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._font_key = self.font().toString()
+            # Force the static text to be laid out again with the new font
+            self._static.setTextWidth(-1)
+            self.updateGeometry()
+        super().changeEvent(event)
+
+    def _bubble_path(self) -> QPainterPath:
+        """Rounded bubble with a tighter corner on the speaker's side."""
+        if self._path_size != self.size():
+            self._path_size = self.size()
+            rect = QRectF(self.rect())
+            large, small = RADIUS["lg"], RADIUS["sm"]
+            path = QPainterPath()
+            path.addRoundedRect(rect, large, large)
+            corner = QPainterPath()
+            x = rect.right() - large if self._is_user else rect.left()
+            corner.addRoundedRect(
+                QRectF(x,
+                       rect.bottom() - large, large, large), small, small)
+            self._path = path.united(corner)
+        return self._path
 
-        layout.addWidget(self.label)
+    def paintEvent(self, event):
+        if self._theme_version != theme_version():
+            self._apply_role_colors()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._bg)
+        painter.drawPath(self._bubble_path())
 
-        self.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Minimum)
-        self.setMaximumWidth(500)
+        pad_x, pad_y = self._padding
+        text_width = self.width() - 2 * pad_x
+        if self._static.textWidth() != text_width:
+            self._static.setTextWidth(text_width)
+            self._static.prepare(QTransform(), self.font())
+        painter.setPen(self._fg)
+        painter.drawStaticText(pad_x, pad_y, self._static)
 
 
 class ChatInput(QWidget):
@@ -168,6 +342,7 @@ class ChatInput(QWidget):
         layout.addWidget(self.input_field, 1)
         layout.addWidget(self.send_btn)
 
+    @Slot()
     def _send_message(self):
         """Send the current message."""
         text = self.input_field.text().strip()
@@ -175,6 +350,7 @@ class ChatInput(QWidget):
             self.message_sent.emit(text)
             self.input_field.clear()
 
+    @Slot(bool)
     def set_voice_active(self, active: bool):
         """Toggle voice button appearance."""
         if active:
@@ -195,16 +371,30 @@ class StatusBar(QFrame):
     A status bar showing AI status, connection state, etc.
     """
 
+    # Default label for each status; the dot color comes from the
+    # QLabel#statusDot[status=...] rules in the theme stylesheet
+    STATUS_TEXT = {
+        "ready": "Ready",
+        "listening": "Listening...",
+        "processing": "Processing...",
+        "speaking": "Speaking...",
+        "error": "Error",
+        "offline": "Offline",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self._status = None
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(SPACING["md"], SPACING["xs"], SPACING["md"],
                                   SPACING["xs"])
 
         # Status indicator
         self.status_dot = QLabel("●")
-        self.status_dot.setFont(QFont(FONTS["family"], 10))
+        self.status_dot.setObjectName("statusDot")
+        self.status_dot.setFont(get_font(10))
 
         # Status text
         self.status_text = QLabel("Ready")
@@ -221,25 +411,22 @@ class StatusBar(QFrame):
 
         self.set_status("ready")
 
+    @Slot(str, str)
     def set_status(self, status: str, text: str = None):
         """Update status indicator."""
-        theme = get_theme()
+        if status not in self.STATUS_TEXT:
+            status = "ready"
 
-        status_config = {
-            "ready": ("●", theme.success, "Ready"),
-            "listening": ("●", theme.warning, "Listening..."),
-            "processing": ("●", theme.info, "Processing..."),
-            "speaking": ("●", theme.info, "Speaking..."),
-            "error": ("●", theme.error, "Error"),
-            "offline": ("●", theme.text_muted, "Offline"),
-        }
-
-        config = status_config.get(status, status_config["ready"])
-        self.status_dot.setText(config[0])
-        self.status_dot.setStyleSheet(
-            f"color: {config[1]}; background: transparent;")
-        self.status_text.setText(text or config[2])
+        # Only repolish the dot when its color actually changes
+        if status != self._status:
+            self._status = status
+            self.status_dot.setProperty("status", status)
+            self.status_dot.style().unpolish(self.status_dot)
+            self.status_dot.style().polish(self.status_dot)
 
+        self.status_text.setText(text or self.STATUS_TEXT[status])
+
+    @Slot(bool)
     def set_connection(self, online: bool):
         """Update connection status."""
         if online:
@@ -248,50 +435,6 @@ class StatusBar(QFrame):
             self.connection_label.setText("📵 Offline")
 
 
-class FeatureCard(Card):
-    """
-    A feature card with icon, title, and description.
-    """
-
-    clicked = Signal()
-
-    def __init__(self, icon: str, title: str, description: str, parent=None):
-        super().__init__(parent, shadow=True, hover=True)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
-                                  SPACING["lg"])
-        layout.setSpacing(SPACING["sm"])
-
-        # Icon
-        icon_label = QLabel(icon)
-        icon_label.setFont(QFont(FONTS["family"], 32))
-        icon_label.setAlignment(Qt.AlignCenter)
-
-        # Title
-        title_label = QLabel(title)
-        title_label.setProperty("class", "subtitle")
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
-
-        # Description
-        desc_label = QLabel(description)
-        desc_label.setProperty("class", "muted")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-
-        layout.addWidget(icon_label)
-        layout.addWidget(title_label)
-        layout.addWidget(desc_label)
-
-        self.setFixedSize(180, 160)
-
-    def mousePressEvent(self, event):
-        self.clicked.emit()
-        super().mousePressEvent(event)
-
-
 class AnimatedToggle(QWidget):
     """
     A modern animated toggle switch.
@@ -299,12 +442,16 @@ class AnimatedToggle(QWidget):
 
     toggled = Signal(bool)
 
+    _HANDLE_BRUSH = QBrush(QColor(255, 255, 255))
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._checked = False
         self._handle_position = 3
 
+        self._apply_theme_colors()
+
         self.setFixedSize(52, 28)
         self.setCursor(Qt.PointingHandCursor)
 
@@ -339,21 +486,26 @@ class AnimatedToggle(QWidget):
     def mousePressEvent(self, event):
         self.setChecked(not self._checked)
 
+    def _apply_theme_colors(self):
+        theme = get_theme()
+        self._theme_version = theme_version()
+        self._bg_on = QBrush(QColor(theme.primary))
+        self._bg_off = QBrush(QColor(theme.bg_tertiary))
+
     def paintEvent(self, event):
+        if self._theme_version != theme_version():
+            self._apply_theme_colors()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        theme = get_theme()
-
         # Background
-        bg_color = QColor(theme.primary) if self._checked else QColor(
-            theme.bg_tertiary)
-        painter.setBrush(bg_color)
+        painter.setBrush(self._bg_on if self._checked else self._bg_off)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(0, 0, 52, 28, 14, 14)
 
         # Handle
-        painter.setBrush(QColor("#ffffff"))
+        painter.setBrush(self._HANDLE_BRUSH)
         painter.drawEllipse(int(self._handle_position), 3, 22, 22)
 
 
@@ -373,7 +525,7 @@ class SectionHeader(QWidget):
         # Title
         title_label = QLabel(title)
         title_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+            get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
 
         layout.addWidget(title_label)
         layout.addStretch()
@@ -402,38 +554,114 @@ class QuickActionButton(QPushButton):
 class FeatureCard(Card):
     """
     A feature card with icon, title, description, and click handling.
+
+    The card paints its content directly rather than through three labels
+    and a layout, since the features panel creates dozens of them.
     """
 
     clicked = Signal()
 
-    def __init__(self, icon: str, title: str, description: str, parent=None):
-        super().__init__(parent, shadow=False, hover=True)
+    # Size used by the fixed-size variant of the card
+    FIXED_SIZE = QSize(180, 160)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(SPACING["md"], SPACING["md"], SPACING["md"],
-                                  SPACING["md"])
-        layout.setSpacing(SPACING["sm"])
+    def __init__(self,
+                 icon: str,
+                 title: str,
+                 description: str,
+                 parent=None,
+                 fixed_size: bool = False,
+                 shadow: bool = False):
+        super().__init__(parent, shadow=shadow, hover=True)
+
+        self._icon = icon
+        self._title = title
+        self._desc = description
+        self._padding = SPACING["md"]
+
+        self._icon_font = get_font(FONTS["size_2xl"])
+        self._title_font = get_font(FONTS["size_md"], FONTS["weight_semibold"])
+        self._desc_font = get_font(FONTS["size_sm"])
+
+        self._apply_theme_colors()
+
+        if fixed_size:
+            self.setFixedSize(self.FIXED_SIZE)
+        else:
+            policy = QSizePolicy(QSizePolicy.Preferred,
+                                 QSizePolicy.Preferred)
+            policy.setHeightForWidth(True)
+            self.setSizePolicy(policy)
+
+    def _line_heights(self):
+        return (QFontMetrics(self._icon_font).height(),
+                QFontMetrics(self._title_font).height())
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        icon_h, title_h = self._line_heights()
+        desc_h = measure_text(self._desc_font, self._desc,
+                              max(1, width - 2 * self._padding)).height()
+        return (2 * self._padding + icon_h + title_h + desc_h +
+                2 * SPACING["sm"])
+
+    def sizeHint(self) -> QSize:
+        width = max(
+            QFontMetrics(self._title_font).horizontalAdvance(self._title),
+            QFontMetrics(self._desc_font).horizontalAdvance(self._desc),
+        ) + 2 * self._padding
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def _apply_theme_colors(self):
+        theme = get_theme()
+        self._theme_version = theme_version()
+        self._bg = QColor(theme.bg_card)
+        self._border = QColor(theme.border)
+        self._title_color = QColor(theme.text_primary)
+        self._desc_color = QColor(theme.text_muted)
+
+    def paintEvent(self, event):
+        if self._theme_version != theme_version():
+            self._apply_theme_colors()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Background
+        painter.setPen(self._border)
+        painter.setBrush(self._bg)
+        painter.drawRoundedRect(
+            QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), RADIUS["lg"],
+            RADIUS["lg"])
+
+        pad = self._padding
+        icon_h, title_h = self._line_heights()
+        rect = self.rect().adjusted(pad, pad, -pad, -pad)
 
         # Icon
-        icon_label = QLabel(icon)
-        icon_label.setFont(QFont(FONTS["family"], FONTS["size_2xl"]))
-        icon_label.setAlignment(Qt.AlignCenter)
+        painter.setFont(self._icon_font)
+        painter.setPen(self._title_color)
+        painter.drawText(QRect(rect.x(), rect.y(), rect.width(), icon_h),
+                         Qt.AlignCenter, self._icon)
 
         # Title
-        title_label = QLabel(title)
-        title_label.setFont(
-            QFont(FONTS["family"], FONTS["size_md"], FONTS["weight_semibold"]))
-        title_label.setAlignment(Qt.AlignCenter)
+        y = rect.y() + icon_h + SPACING["sm"]
+        painter.setFont(self._title_font)
+        painter.drawText(QRect(rect.x(), y, rect.width(), title_h),
+                         Qt.AlignCenter, self._title)
 
         # Description
-        desc_label = QLabel(description)
-        desc_label.setProperty("class", "muted")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-
-        layout.addWidget(icon_label)
-        layout.addWidget(title_label)
-        layout.addWidget(desc_label)
+        y += title_h + SPACING["sm"]
+        painter.setFont(self._desc_font)
+        painter.setPen(self._desc_color)
+        painter.drawText(QRect(rect.x(), y, rect.width(),
+                               rect.bottom() - y + 1),
+                         Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap,
+                         self._desc)
 
     def mousePressEvent(self, event):
         """Handle click events."""
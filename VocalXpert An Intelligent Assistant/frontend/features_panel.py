@@ -13,11 +13,72 @@ from PySide6.QtWidgets import (
     QFrame,
     QScrollArea,
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
+
+from .components import Card, FeatureCard, apply_gpu_viewport
+from .themes import FONTS, SPACING, get_font, get_theme
+
+# Approximate FeatureCard height, used to size placeholders for unbuilt grids
+_CARD_HEIGHT = 98
+_GRID_COLUMNS = 3
+
+# Feature cards per section: (icon, title, description, command)
+_INFO_FEATURES = (
+    ("📰", "News", "Latest headlines", "latest news"),
+    ("🔍", "Google Search", "Search the web", "search google for"),
+    ("📖", "Wikipedia", "Knowledge lookup", "wikipedia"),
+    ("⏰", "Time", "Current time", "what time is it"),
+    ("📅", "Date", "this date", "what is the date"),
+    ("📚", "Dictionary", "Word definitions", "dictionary meaning of word"),
+    ("😂", "Jokes", "Tell me a joke", "tell me a joke"),
+    ("🗺️", "Maps", "Open Google Maps", "open maps"),
+    ("📍", "Directions", "Get directions", "directions to"),
+)
+
+_PRODUCTIVITY_FEATURES = (
+    ("📝", "To-Do List", "View your tasks", "show my to do list"),
+    ("➕", "Add Task", "Add to your list", "add to my list"),
+    ("⏲️", "Set Timer", "Set a timer", "set timer for 5 minutes"),
+    ("🧮", "Calculator", "Math operations", "calculate 5 plus 3"),
+    ("📄", "Create File", "Make new files", "create text file"),
+    ("🌐", "HTML Project", "Create web project", "create html project"),
+    ("✉️", "Send Email", "Compose email", "send email"),
+    ("💬", "WhatsApp", "Send message", "send whatsapp"),
+    ("🌍", "Translate", "Translate text", "translate hello to spanish"),
+)
 
-from .components import Card, FeatureCard
-from .themes import FONTS, SPACING, get_theme
+_MEDIA_FEATURES = (
+    ("▶️", "YouTube", "Play videos", "play on youtube"),
+    ("🎲", "Dice Roll", "Roll the dice", "roll a dice"),
+    ("🪙", "Coin Flip", "Flip a coin", "flip a coin"),
+    ("✊", "Rock Paper Scissors", "Play RPS", "play rock paper scissors"),
+    ("🖼️", "Download Images", "Get images", "download images of"),
+    ("🎵", "Music", "Play music", "open spotify"),
+)
+
+_SYSTEM_FEATURES = (
+    ("🔊", "Volume Up", "Increase volume", "volume up"),
+    ("🔉", "Volume Down", "Decrease volume", "volume down"),
+    ("🔇", "Mute", "Toggle mute", "mute"),
+    ("📸", "Screenshot", "Capture screen", "take screenshot"),
+    ("🔒", "Lock PC", "Lock computer", "lock pc"),
+    ("💻", "System Info", "View specs", "system info"),
+    ("🔋", "Battery", "Battery status", "battery status"),
+    ("😴", "Sleep", "Sleep computer", "sleep pc"),
+    ("🔄", "Restart", "Restart PC", "restart pc"),
+)
+
+_APPS_FEATURES = (
+    ("📁", "File Explorer", "Open files", "open explorer"),
+    ("🌐", "Chrome", "Web browser", "open chrome"),
+    ("📝", "Notepad", "Text editor", "open notepad"),
+    ("🖥️", "VS Code", "Code editor", "open vs code"),
+    ("🎨", "Paint", "Drawing app", "open paint"),
+    ("📊", "Excel", "Spreadsheets", "open excel"),
+    ("📄", "Word", "Documents", "open word"),
+    ("💼", "PowerPoint", "Presentations", "open powerpoint"),
+    ("🧮", "Calculator", "Calculator app", "open calculator"),
+)
 
 
 class FeaturesPanel(QWidget):
@@ -29,6 +90,8 @@ class FeaturesPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # [placeholder, features] pairs whose grids haven't been built yet
+        self._lazy_sections = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -38,6 +101,7 @@ class FeaturesPanel(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setFrameShape(QFrame.NoFrame)
+        apply_gpu_viewport(scroll)
 
         # Content
         content = QWidget()
@@ -57,51 +121,48 @@ class FeaturesPanel(QWidget):
         # Information section
         info_label = QLabel("📚 Information")
         info_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+            get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
         layout.addWidget(info_label)
 
-        info_grid = self._create_info_grid()
-        layout.addWidget(info_grid)
+        self._add_lazy_grid(layout, _INFO_FEATURES)
 
         # Productivity section
         productivity_label = QLabel("📝 Productivity")
         productivity_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+            get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
         layout.addWidget(productivity_label)
 
-        productivity_grid = self._create_productivity_grid()
-        layout.addWidget(productivity_grid)
+        self._add_lazy_grid(layout, _PRODUCTIVITY_FEATURES)
 
         # Media section
         media_label = QLabel("🎬 Media & Entertainment")
         media_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+            get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
         layout.addWidget(media_label)
 
-        media_grid = self._create_media_grid()
-        layout.addWidget(media_grid)
+        self._add_lazy_grid(layout, _MEDIA_FEATURES)
 
         # System controls
         system_label = QLabel("⚙️ System Controls")
         system_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+            get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
         layout.addWidget(system_label)
 
-        system_grid = self._create_system_grid()
-        layout.addWidget(system_grid)
+        self._add_lazy_grid(layout, _SYSTEM_FEATURES)
 
         # Applications section
         apps_label = QLabel("📱 Applications")
         apps_label.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+            get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
         layout.addWidget(apps_label)
 
-        apps_grid = self._create_apps_grid()
-        layout.addWidget(apps_grid)
+        self._add_lazy_grid(layout, _APPS_FEATURES)
 
         layout.addStretch()
 
         scroll.setWidget(content)
+        self.scroll = scroll
+        scroll.verticalScrollBar().valueChanged.connect(self._maybe_realize)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -115,8 +176,7 @@ class FeaturesPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, SPACING["lg"])
 
         title = QLabel("✨ Features")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_2xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_2xl"], FONTS["weight_bold"]))
 
         subtitle = QLabel(
             "Quick access to all VocalXpert capabilities - click any card or use voice commands"
@@ -140,15 +200,14 @@ class FeaturesPanel(QWidget):
 
         # Weather icon
         icon = QLabel("🌤️")
-        icon.setFont(QFont(FONTS["family"], 48))
+        icon.setFont(get_font(48))
 
         # Weather info
         info_layout = QVBoxLayout()
         info_layout.setSpacing(SPACING["xs"])
 
         title = QLabel("Weather")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
+        title.setFont(get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
 
         self.weather_text = QLabel("Click to check current weather")
         self.weather_text.setProperty("class", "muted")
@@ -162,143 +221,74 @@ class FeaturesPanel(QWidget):
 
         return card
 
-    def _create_info_grid(self) -> QWidget:
-        """Create information features grid."""
-        container = QWidget()
-        layout = QGridLayout(container)
-        layout.setSpacing(SPACING["md"])
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        features = [
-            ("📰", "News", "Latest headlines", "latest news"),
-            ("🔍", "Google Search", "Search the web", "search google for"),
-            ("📖", "Wikipedia", "Knowledge lookup", "wikipedia"),
-            ("⏰", "Time", "Current time", "what time is it"),
-            ("📅", "Date", "this date", "what is the date"),
-            ("📚", "Dictionary", "Word definitions",
-             "dictionary meaning of word"),
-            ("😂", "Jokes", "Tell me a joke", "tell me a joke"),
-            ("🗺️", "Maps", "Open Google Maps", "open maps"),
-            ("📍", "Directions", "Get directions", "directions to"),
-        ]
-
-        for i, (icon, title, desc, cmd) in enumerate(features):
-            card = FeatureCard(icon, title, desc)
-            card.clicked.connect(self._make_handler(cmd))
-            layout.addWidget(card, i // 3, i % 3)
-
-        return container
-
-    def _create_productivity_grid(self) -> QWidget:
-        """Create productivity features grid."""
-        container = QWidget()
-        layout = QGridLayout(container)
-        layout.setSpacing(SPACING["md"])
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        features = [
-            ("📝", "To-Do List", "View your tasks", "show my to do list"),
-            ("➕", "Add Task", "Add to your list", "add to my list"),
-            ("⏲️", "Set Timer", "Set a timer", "set timer for 5 minutes"),
-            ("🧮", "Calculator", "Math operations", "calculate 5 plus 3"),
-            ("📄", "Create File", "Make new files", "create text file"),
-            ("🌐", "HTML Project", "Create web project", "create html project"),
-            ("✉️", "Send Email", "Compose email", "send email"),
-            ("💬", "WhatsApp", "Send message", "send whatsapp"),
-            ("🌍", "Translate", "Translate text", "translate hello to spanish"),
-        ]
-
-        for i, (icon, title, desc, cmd) in enumerate(features):
-            card = FeatureCard(icon, title, desc)
-            card.clicked.connect(self._make_handler(cmd))
-            layout.addWidget(card, i // 3, i % 3)
-
-        return container
-
-    def _create_media_grid(self) -> QWidget:
-        """Create media features grid."""
+    def _add_lazy_grid(self, layout: QVBoxLayout, features: tuple):
+        """Reserve space for a feature grid that is built once near view."""
+        rows = -(-len(features) // _GRID_COLUMNS)
+        placeholder = QWidget()
+        placeholder.setFixedHeight(rows * (_CARD_HEIGHT + SPACING["md"]) -
+                                   SPACING["md"])
+        layout.addWidget(placeholder)
+        self._lazy_sections.append((placeholder, features))
+
+    def _create_grid(self, features: tuple) -> QWidget:
+        """Create a grid of feature cards."""
         container = QWidget()
         layout = QGridLayout(container)
         layout.setSpacing(SPACING["md"])
         layout.setContentsMargins(0, 0, 0, 0)
-
-        features = [
-            ("▶️", "YouTube", "Play videos", "play on youtube"),
-            ("🎲", "Dice Roll", "Roll the dice", "roll a dice"),
-            ("🪙", "Coin Flip", "Flip a coin", "flip a coin"),
-            ("✊", "Rock Paper Scissors", "Play RPS",
-             "play rock paper scissors"),
-            ("🖼️", "Download Images", "Get images", "download images of"),
-            ("🎵", "Music", "Play music", "open spotify"),
-        ]
+        for column in range(_GRID_COLUMNS):
+            layout.setColumnStretch(column, 1)
 
         for i, (icon, title, desc, cmd) in enumerate(features):
             card = FeatureCard(icon, title, desc)
-            card.clicked.connect(self._make_handler(cmd))
-            layout.addWidget(card, i // 3, i % 3)
-
-        return container
-
-    def _create_system_grid(self) -> QWidget:
-        """Create system controls grid."""
-        container = QWidget()
-        layout = QGridLayout(container)
-        layout.setSpacing(SPACING["md"])
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        controls = [
-            ("🔊", "Volume Up", "Increase volume", "volume up"),
-            ("🔉", "Volume Down", "Decrease volume", "volume down"),
-            ("🔇", "Mute", "Toggle mute", "mute"),
-            ("📸", "Screenshot", "Capture screen", "take screenshot"),
-            ("🔒", "Lock PC", "Lock computer", "lock pc"),
-            ("💻", "System Info", "View specs", "system info"),
-            ("🔋", "Battery", "Battery status", "battery status"),
-            ("😴", "Sleep", "Sleep computer", "sleep pc"),
-            ("🔄", "Restart", "Restart PC", "restart pc"),
-        ]
-
-        for i, (icon, title, desc, cmd) in enumerate(controls):
-            card = FeatureCard(icon, title, desc)
-            card.clicked.connect(self._make_handler(cmd))
-            layout.addWidget(card, i // 3, i % 3)
+            card.setProperty("command", cmd)
+            card.clicked.connect(self._on_feature_clicked)
+            layout.addWidget(card, i // _GRID_COLUMNS, i % _GRID_COLUMNS)
 
         return container
 
-    def _create_apps_grid(self) -> QWidget:
-        """Create applications grid."""
-        container = QWidget()
-        layout = QGridLayout(container)
-        layout.setSpacing(SPACING["md"])
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        apps = [
-            ("📁", "File Explorer", "Open files", "open explorer"),
-            ("🌐", "Chrome", "Web browser", "open chrome"),
-            ("📝", "Notepad", "Text editor", "open notepad"),
-            ("🖥️", "VS Code", "Code editor", "open vs code"),
-            ("🎨", "Paint", "Drawing app", "open paint"),
-            ("📊", "Excel", "Spreadsheets", "open excel"),
-            ("📄", "Word", "Documents", "open word"),
-            ("💼", "PowerPoint", "Presentations", "open powerpoint"),
-            ("🧮", "Calculator", "Calculator app", "open calculator"),
-        ]
-
-        for i, (icon, title, desc, cmd) in enumerate(apps):
-            card = FeatureCard(icon, title, desc)
-            card.clicked.connect(self._make_handler(cmd))
-            layout.addWidget(card, i // 3, i % 3)
-
-        return container
-
-    def _make_handler(self, cmd: str):
-        """Create a handler function for the given command."""
-
-        def handler():
-            self.feature_clicked.emit(cmd)
-
-        return handler
-
+    @Slot()
+    def _maybe_realize(self):
+        """Build the grids whose placeholders intersect the viewport."""
+        if not self._lazy_sections or not self.isVisible():
+            return
+        viewport = self.scroll.viewport()
+        # Look one screen ahead so cards are ready before they scroll in
+        visible = viewport.rect().translated(
+            0, self.scroll.verticalScrollBar().value())
+        visible.setHeight(visible.height() * 2)
+
+        content = self.scroll.widget()
+        layout = content.layout()
+        pending = []
+        # Swap in all the grids that came into view with a single repaint
+        content.setUpdatesEnabled(False)
+        for placeholder, features in self._lazy_sections:
+            if placeholder.geometry().intersects(visible):
+                grid = self._create_grid(features)
+                layout.replaceWidget(placeholder, grid)
+                placeholder.deleteLater()
+            else:
+                pending.append((placeholder, features))
+        content.setUpdatesEnabled(True)
+        self._lazy_sections = pending
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Geometry is only final once the pending layout pass has run
+        QTimer.singleShot(0, self, self._maybe_realize)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._lazy_sections:
+            QTimer.singleShot(0, self, self._maybe_realize)
+
+    @Slot()
+    def _on_feature_clicked(self):
+        """Emit the command of the feature card that was clicked."""
+        self.feature_clicked.emit(self.sender().property("command"))
+
+    @Slot(str)
     def update_weather(self, weather_text: str):
         """Update weather display."""
         self.weather_text.setText(weather_text)
@@ -5,6 +5,7 @@ Rock Paper Scissors, Dice Roll, Coin Flip, and more.
 """
 
 import random
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,11 +17,52 @@ from PySide6.QtWidgets import (
     QStackedWidget,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    Slot,
+    QPropertyAnimation,
+    QEasingCurve,
+    Property,
+)
 
 from .components import Card, FeatureCard, IconButton
-from .themes import FONTS, SPACING, get_theme
+from .themes import FONTS, SPACING, get_font, get_theme
+
+# Dice/coin roll animation: random faces shown, and total length (ms)
+_ANIMATION_FRAMES = 10
+_ANIMATION_DURATION = 1000
+
+_DICE_FACES = ("⚀", "⚁", "⚂", "⚃", "⚄", "⚅")
+_COIN_FACES = ("🪙", "⭕")
+
+# Game cards on the selection page: (icon, title, description, game key)
+_GAMES = (
+    ("✊✋✌️", "Rock Paper Scissors", "Classic hand game", "rps"),
+    ("🎲", "Dice Roll", "Roll the dice!", "dice"),
+    ("🪙", "Coin Flip", "Heads or tails?", "coin"),
+)
+_GAME_COLUMNS = 3
+
+# Rock Paper Scissors moves, and the (user, bot) pairs the user wins
+_RPS_EMOJIS = {"Rock": "✊", "Paper": "✋", "Scissors": "✌️"}
+_RPS_CHOICES = tuple(_RPS_EMOJIS)
+_RPS_WINS = frozenset({
+    ("Rock", "Scissors"),
+    ("Paper", "Rock"),
+    ("Scissors", "Paper"),
+})
+
+
+def _make_back_row(on_back) -> QHBoxLayout:
+    """Build the left-aligned "Back to Games" row shared by game pages."""
+    back_row = QHBoxLayout()
+    back_btn = QPushButton("← Back to Games")
+    back_btn.setProperty("class", "ghost")
+    back_btn.clicked.connect(on_back)
+    back_row.addWidget(back_btn)
+    back_row.addStretch()
+    return back_row
 
 
 class GamesPanel(QWidget):
@@ -30,6 +72,13 @@ class GamesPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Game pages are only built the first time they are opened
+        self._game_factories = {
+            "rps": RPSGame,
+            "dice": DiceGame,
+            "coin": CoinGame,
+        }
+        self._games = {}
         self._setup_ui()
 
     def _setup_ui(self):
@@ -47,26 +96,8 @@ class GamesPanel(QWidget):
         self.stack = QStackedWidget()
 
         # Game selection page
-        selection_page = self._create_selection_page()
-        self.stack.addWidget(selection_page)
-
-        # RPS game page
-        self.rps_game = RPSGame()
-        self.rps_game.back_clicked.connect(
-            lambda: self.stack.setCurrentIndex(0))
-        self.stack.addWidget(self.rps_game)
-
-        # Dice game page
-        self.dice_game = DiceGame()
-        self.dice_game.back_clicked.connect(
-            lambda: self.stack.setCurrentIndex(0))
-        self.stack.addWidget(self.dice_game)
-
-        # Coin game page
-        self.coin_game = CoinGame()
-        self.coin_game.back_clicked.connect(
-            lambda: self.stack.setCurrentIndex(0))
-        self.stack.addWidget(self.coin_game)
+        self.selection_page = self._create_selection_page()
+        self.stack.addWidget(self.selection_page)
 
         layout.addWidget(self.stack, 1)
 
@@ -77,8 +108,7 @@ class GamesPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, SPACING["lg"])
 
         title = QLabel("🎮 Games")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_2xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_2xl"], FONTS["weight_bold"]))
 
         subtitle = QLabel("Take a break and have some fun!")
         subtitle.setProperty("class", "muted")
@@ -93,34 +123,46 @@ class GamesPanel(QWidget):
         page = QWidget()
         layout = QGridLayout(page)
         layout.setSpacing(SPACING["lg"])
+        for column in range(_GAME_COLUMNS):
+            layout.setColumnStretch(column, 1)
 
-        games = [
-            ("✊✋✌️", "Rock Paper Scissors", "Classic hand game", 1),
-            ("🎲", "Dice Roll", "Roll the dice!", 2),
-            ("🪙", "Coin Flip", "Heads or tails?", 3),
-        ]
-
-        for i, (icon, title, desc, idx) in enumerate(games):
+        for i, (icon, title, desc, key) in enumerate(_GAMES):
             card = FeatureCard(icon, title, desc)
-            card.clicked.connect(self._make_game_handler(idx))
-            layout.addWidget(card, i // 3, i % 3)
+            card.setProperty("game", key)
+            card.clicked.connect(self._on_game_clicked)
+            layout.addWidget(card, i // _GAME_COLUMNS, i % _GAME_COLUMNS)
 
         layout.setRowStretch(1, 1)
 
         return page
 
-    def _make_game_handler(self, index: int):
-        """Create a handler function for opening a game."""
-
-        def handler():
-            self.stack.setCurrentIndex(index)
-
-        return handler
-
+    def _game(self, key: str) -> QWidget:
+        """Get a game page, building it on first use."""
+        game = self._games.get(key)
+        if game is None:
+            game = self._game_factories[key]()
+            game.back_clicked.connect(self._go_home)
+            self.stack.addWidget(game)
+            self._games[key] = game
+        return game
+
+    @Slot()
+    def _on_game_clicked(self):
+        """Show the page of the game card that was clicked."""
+        game = self._game(self.sender().property("game"))
+        self.stack.setCurrentWidget(game)
+
+    @Slot()
+    def _go_home(self):
+        """Return to the game selection page."""
+        self.stack.setCurrentWidget(self.selection_page)
+
+    @Slot()
     def open_rps(self):
         """Open Rock Paper Scissors game."""
-        self.stack.setCurrentIndex(1)
-        self.rps_game.reset()
+        game = self._game("rps")
+        self.stack.setCurrentWidget(game)
+        game.reset()
 
 
 class RPSGame(QWidget):
@@ -142,18 +184,11 @@ class RPSGame(QWidget):
         layout.setSpacing(SPACING["xl"])
 
         # Back button
-        back_row = QHBoxLayout()
-        back_btn = QPushButton("← Back to Games")
-        back_btn.setProperty("class", "ghost")
-        back_btn.clicked.connect(self.back_clicked)
-        back_row.addWidget(back_btn)
-        back_row.addStretch()
-        layout.addLayout(back_row)
+        layout.addLayout(_make_back_row(self.back_clicked))
 
         # Title
         title = QLabel("✊✋✌️ Rock Paper Scissors")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_xl"], FONTS["weight_bold"]))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -168,8 +203,7 @@ class RPSGame(QWidget):
         user_label = QLabel("You")
         user_label.setAlignment(Qt.AlignCenter)
         self.user_score_label = QLabel("0")
-        self.user_score_label.setFont(
-            QFont(FONTS["family"], 48, FONTS["weight_bold"]))
+        self.user_score_label.setFont(get_font(48, FONTS["weight_bold"]))
         self.user_score_label.setAlignment(Qt.AlignCenter)
         theme = get_theme()
         self.user_score_label.setStyleSheet(f"color: {theme.success};")
@@ -178,8 +212,7 @@ class RPSGame(QWidget):
 
         # VS
         vs_label = QLabel("VS")
-        vs_label.setFont(
-            QFont(FONTS["family"], FONTS["size_xl"], FONTS["weight_bold"]))
+        vs_label.setFont(get_font(FONTS["size_xl"], FONTS["weight_bold"]))
         vs_label.setAlignment(Qt.AlignCenter)
         vs_label.setProperty("class", "muted")
 
@@ -188,8 +221,7 @@ class RPSGame(QWidget):
         bot_label = QLabel("Bot")
         bot_label.setAlignment(Qt.AlignCenter)
         self.bot_score_label = QLabel("0")
-        self.bot_score_label.setFont(
-            QFont(FONTS["family"], 48, FONTS["weight_bold"]))
+        self.bot_score_label.setFont(get_font(48, FONTS["weight_bold"]))
         self.bot_score_label.setAlignment(Qt.AlignCenter)
         self.bot_score_label.setStyleSheet(f"color: {theme.error};")
         bot_score_layout.addWidget(bot_label)
@@ -203,7 +235,7 @@ class RPSGame(QWidget):
 
         # Result area
         self.result_label = QLabel("Choose your move!")
-        self.result_label.setFont(QFont(FONTS["family"], FONTS["size_lg"]))
+        self.result_label.setFont(get_font(FONTS["size_lg"]))
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
 
@@ -211,15 +243,15 @@ class RPSGame(QWidget):
         emoji_layout = QHBoxLayout()
 
         self.user_emoji = QLabel("❓")
-        self.user_emoji.setFont(QFont(FONTS["family"], 72))
+        self.user_emoji.setFont(get_font(72))
         self.user_emoji.setAlignment(Qt.AlignCenter)
 
         self.vs_emoji = QLabel("⚔️")
-        self.vs_emoji.setFont(QFont(FONTS["family"], 32))
+        self.vs_emoji.setFont(get_font(32))
         self.vs_emoji.setAlignment(Qt.AlignCenter)
 
         self.bot_emoji = QLabel("❓")
-        self.bot_emoji.setFont(QFont(FONTS["family"], 72))
+        self.bot_emoji.setFont(get_font(72))
         self.bot_emoji.setAlignment(Qt.AlignCenter)
 
         emoji_layout.addWidget(self.user_emoji, 1)
@@ -232,44 +264,35 @@ class RPSGame(QWidget):
         choice_layout = QHBoxLayout()
         choice_layout.setSpacing(SPACING["lg"])
 
-        choices = [("✊", "Rock"), ("✋", "Paper"), ("✌️", "Scissors")]
-
-        for emoji, name in choices:
+        for name, emoji in _RPS_EMOJIS.items():
             btn = QPushButton(emoji)
-            btn.setFont(QFont(FONTS["family"], 32))
+            btn.setFont(get_font(32))
             btn.setFixedSize(100, 100)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.clicked.connect(self._make_play_handler(name))
+            btn.setProperty("choice", name)
+            btn.clicked.connect(self._on_choice_clicked)
             choice_layout.addWidget(btn)
 
         layout.addLayout(choice_layout)
         layout.addStretch()
 
-    def _make_play_handler(self, choice: str):
-        """Create handler for play button."""
-
-        def handler():
-            self._play(choice)
-
-        return handler
+    @Slot()
+    def _on_choice_clicked(self):
+        """Play a round with the choice of the button that was clicked."""
+        self._play(self.sender().property("choice"))
 
     def _play(self, user_choice: str):
         """Play a round."""
-        choices = ["Rock", "Paper", "Scissors"]
-        emojis = {"Rock": "✊", "Paper": "✋", "Scissors": "✌️"}
-
-        bot_choice = random.choice(choices)
+        bot_choice = random.choice(_RPS_CHOICES)
 
         # Update emojis
-        self.user_emoji.setText(emojis[user_choice])
-        self.bot_emoji.setText(emojis[bot_choice])
+        self.user_emoji.setText(_RPS_EMOJIS[user_choice])
+        self.bot_emoji.setText(_RPS_EMOJIS[bot_choice])
 
         # Determine winner
         if user_choice == bot_choice:
             result = "It's a tie! 🤝"
-        elif ((user_choice == "Rock" and bot_choice == "Scissors") or
-              (user_choice == "Paper" and bot_choice == "Rock") or
-              (user_choice == "Scissors" and bot_choice == "Paper")):
+        elif (user_choice, bot_choice) in _RPS_WINS:
             result = "You win! 🎉"
             self._user_score += 1
             self.user_score_label.setText(str(self._user_score))
@@ -300,6 +323,9 @@ class DiceGame(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._frame = -1
+        self._faces = ()
+        self._final_value = 1
         self._setup_ui()
 
     def _setup_ui(self):
@@ -308,18 +334,11 @@ class DiceGame(QWidget):
         layout.setSpacing(SPACING["xl"])
 
         # Back button
-        back_row = QHBoxLayout()
-        back_btn = QPushButton("← Back to Games")
-        back_btn.setProperty("class", "ghost")
-        back_btn.clicked.connect(self.back_clicked)
-        back_row.addWidget(back_btn)
-        back_row.addStretch()
-        layout.addLayout(back_row)
+        layout.addLayout(_make_back_row(self.back_clicked))
 
         # Title
         title = QLabel("🎲 Dice Roll")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_xl"], FONTS["weight_bold"]))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -327,13 +346,13 @@ class DiceGame(QWidget):
 
         # Dice display
         self.dice_label = QLabel("🎲")
-        self.dice_label.setFont(QFont(FONTS["family"], 120))
+        self.dice_label.setFont(get_font(120))
         self.dice_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.dice_label)
 
         # Result
         self.result_label = QLabel("Click to roll!")
-        self.result_label.setFont(QFont(FONTS["family"], FONTS["size_xl"]))
+        self.result_label.setFont(get_font(FONTS["size_xl"]))
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
 
@@ -341,29 +360,47 @@ class DiceGame(QWidget):
 
         # Roll button
         roll_btn = QPushButton("🎲  Roll Dice")
-        roll_btn.setFont(QFont(FONTS["family"], FONTS["size_lg"]))
+        roll_btn.setFont(get_font(FONTS["size_lg"]))
         roll_btn.setMinimumHeight(60)
         roll_btn.clicked.connect(self._roll)
         layout.addWidget(roll_btn)
 
+        # Steps the frame property, easing out so the dice slows down
+        self._animation = QPropertyAnimation(self, b"frame", self)
+        self._animation.setDuration(_ANIMATION_DURATION)
+        self._animation.setStartValue(0)
+        self._animation.setEndValue(_ANIMATION_FRAMES)
+        self._animation.setEasingCurve(QEasingCurve.OutQuad)
+        self._animation.finished.connect(self._show_result)
+
+    def get_frame(self):
+        return self._frame
+
+    def set_frame(self, frame):
+        # The animation interpolates every tick; only new frames repaint
+        if frame == self._frame:
+            return
+        self._frame = frame
+        if frame < _ANIMATION_FRAMES:
+            self.dice_label.setText(self._faces[frame])
+
+    frame = Property(int, get_frame, set_frame)
+
+    @Slot()
     def _roll(self):
         """Roll the dice with animation."""
-        dice_faces = ["⚀", "⚁", "⚂", "⚃", "⚄", "⚅"]
-
-        # Animate
-        self._animation_count = 0
+        # Draw every animation face up front in one call
+        self._faces = random.choices(_DICE_FACES, k=_ANIMATION_FRAMES)
         self._final_value = random.randint(1, 6)
+        self._animation.stop()
+        self._frame = -1
+        self._animation.start()
 
-        def animate():
-            self._animation_count += 1
-            if self._animation_count < 10:
-                self.dice_label.setText(random.choice(dice_faces))
-                QTimer.singleShot(100, animate)
-            else:
-                self.dice_label.setText(dice_faces[self._final_value - 1])
-                self.result_label.setText(f"You rolled: {self._final_value}!")
-
-        animate()
+    @Slot()
+    def _show_result(self):
+        """Show the rolled face once the animation ends."""
+        self.dice_label.setText(_DICE_FACES[self._final_value - 1])
+        self.result_label.setText(f"You rolled: {self._final_value}!")
 
 
 class CoinGame(QWidget):
@@ -375,6 +412,9 @@ class CoinGame(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._frame = -1
+        self._faces = ()
+        self._final_value = "Heads"
         self._setup_ui()
 
     def _setup_ui(self):
@@ -383,18 +423,11 @@ class CoinGame(QWidget):
         layout.setSpacing(SPACING["xl"])
 
         # Back button
-        back_row = QHBoxLayout()
-        back_btn = QPushButton("← Back to Games")
-        back_btn.setProperty("class", "ghost")
-        back_btn.clicked.connect(self.back_clicked)
-        back_row.addWidget(back_btn)
-        back_row.addStretch()
-        layout.addLayout(back_row)
+        layout.addLayout(_make_back_row(self.back_clicked))
 
         # Title
         title = QLabel("🪙 Coin Flip")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_xl"], FONTS["weight_bold"]))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -402,13 +435,13 @@ class CoinGame(QWidget):
 
         # Coin display
         self.coin_label = QLabel("🪙")
-        self.coin_label.setFont(QFont(FONTS["family"], 120))
+        self.coin_label.setFont(get_font(120))
         self.coin_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.coin_label)
 
         # Result
         self.result_label = QLabel("Click to flip!")
-        self.result_label.setFont(QFont(FONTS["family"], FONTS["size_xl"]))
+        self.result_label.setFont(get_font(FONTS["size_xl"]))
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
 
@@ -416,27 +449,47 @@ class CoinGame(QWidget):
 
         # Flip button
         flip_btn = QPushButton("🪙  Flip Coin")
-        flip_btn.setFont(QFont(FONTS["family"], FONTS["size_lg"]))
+        flip_btn.setFont(get_font(FONTS["size_lg"]))
         flip_btn.setMinimumHeight(60)
         flip_btn.clicked.connect(self._flip)
         layout.addWidget(flip_btn)
 
+        # Steps the frame property, easing out so the coin slows down
+        self._animation = QPropertyAnimation(self, b"frame", self)
+        self._animation.setDuration(_ANIMATION_DURATION)
+        self._animation.setStartValue(0)
+        self._animation.setEndValue(_ANIMATION_FRAMES)
+        self._animation.setEasingCurve(QEasingCurve.OutQuad)
+        self._animation.finished.connect(self._show_result)
+
+    def get_frame(self):
+        return self._frame
+
+    def set_frame(self, frame):
+        # The animation interpolates every tick; only new frames repaint
+        if frame == self._frame:
+            return
+        self._frame = frame
+        if frame < _ANIMATION_FRAMES:
+            self.coin_label.setText(self._faces[frame])
+
+    frame = Property(int, get_frame, set_frame)
+
+    @Slot()
     def _flip(self):
         """Flip the coin with animation."""
-        # Animate
-        self._animation_count = 0
-        self._final_value = random.choice(["Heads", "Tails"])
-
-        def animate():
-            self._animation_count += 1
-            if self._animation_count < 10:
-                self.coin_label.setText(random.choice(["🪙", "⭕"]))
-                QTimer.singleShot(100, animate)
-            else:
-                if self._final_value == "Heads":
-                    self.coin_label.setText("👑")
-                else:
-                    self.coin_label.setText("🦅")
-                self.result_label.setText(f"It's {self._final_value}!")
-
-        animate()
+        # Draw every animation face up front in one call
+        self._faces = random.choices(_COIN_FACES, k=_ANIMATION_FRAMES)
+        self._final_value = random.choice(("Heads", "Tails"))
+        self._animation.stop()
+        self._frame = -1
+        self._animation.start()
+
+    @Slot()
+    def _show_result(self):
+        """Show the landed side once the animation ends."""
+        if self._final_value == "Heads":
+            self.coin_label.setText("👑")
+        else:
+            self.coin_label.setText("🦅")
+        self.result_label.setText(f"It's {self._final_value}!")
@@ -7,7 +7,12 @@ Features: Search, filtering, date grouping, and smooth animations.
 
 import json
 import os
+import sys
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -23,140 +28,323 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QLineEdit,
     QComboBox,
-    QGraphicsDropShadowEffect,
     QStackedWidget,
     QGridLayout,
     QSpacerItem,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QAbstractItemView,
+)
+from PySide6.QtCore import (
+    Qt,
+    Slot,
+    QTimer,
+    QFileSystemWatcher,
+    QPropertyAnimation,
+    QEasingCurve,
+    QSize,
+    QRect,
+    QRectF,
+    QAbstractListModel,
+    QModelIndex,
 )
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QSize
-from PySide6.QtGui import QFont, QColor, QIcon
+from PySide6.QtGui import QFont, QColor, QIcon, QFontMetrics, QPainter
+
+# Optional: stream the history file instead of parsing all of it
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from .components import Card, SectionHeader
-from .themes import FONTS, SPACING, get_theme
+from .themes import (
+    FONTS,
+    SPACING,
+    Theme,
+    get_font,
+    get_theme,
+    theme_version,
+)
 
 
-class ConversationCard(QFrame):
-    """A styled card for displaying a single conversation in the list."""
+_SOURCE_ICONS = {"voice": "🎤", "text": "💬", "chat": "💭"}
+# Source filter combo entries and the conversation source each one keeps
+_SOURCE_FILTERS = {"💭 Chat": "chat", "🎤 Voice": "voice", "💬 Text": "text"}
+# Date filter combo entries that keep conversations at most N days old
+_DATE_WINDOWS = {"Last 7 Days": 7, "Last 30 Days": 30}
 
-    clicked = Signal(dict)
+_HISTORY_FILE = os.path.join("userData", "conversation_history.json")
+# Most recent conversations listed in the panel
+_HISTORY_LIMIT = 100
+# Delay before re-reading a changed history file, so the writer can finish
+_RELOAD_DELAY_MS = 300
 
-    def __init__(self, conversation: dict, parent=None):
-        super().__init__(parent)
-        self.conversation = conversation
-        self.selected = False
-        self._setup_ui()
+# Delay before re-filtering: typing in the search box, and changing a combo
+_SEARCH_DEBOUNCE_MS = 200
+_FILTER_DEBOUNCE_MS = 50
 
-    def _setup_ui(self):
-        """Setup the conversation card UI."""
-        theme = get_theme()
+# Filter results kept for reuse while a search query is extended
+_SEARCH_CACHE_SIZE = 32
 
-        self.setFixedHeight(90)
-        self.setCursor(Qt.PointingHandCursor)
-        self._update_style(False)
+# Python 3.11+ parses a trailing "Z" in fromisoformat() itself
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 12, 16, 12)
-        layout.setSpacing(6)
 
-        # Top row: timestamp and source badge
-        top_row = QHBoxLayout()
-        top_row.setSpacing(8)
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO 8601 conversation timestamp, memoized."""
+    if not _ISO_ACCEPTS_Z:
+        timestamp = timestamp.replace("Z", "+00:00")
+    return datetime.fromisoformat(timestamp)
 
-        # Time icon and timestamp
-        timestamp = self.conversation.get("timestamp", "")[:16]
-        try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            time_display = dt.strftime("%b %d, %Y • %I:%M %p")
-        except BaseException:
-            time_display = timestamp
 
-        time_label = QLabel(f"🕐 {time_display}")
-        time_label.setStyleSheet(f"""
-            color: {theme.text_muted};
-            font-size: 11px;
-            font-weight: 500;
-        """)
+def _local_datetime(timestamp: str) -> Optional[datetime]:
+    """Parse a timestamp as naive local time, or None if it is invalid."""
+    try:
+        parsed = _parse_timestamp(timestamp)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
 
-        # Source badge
-        source = self.conversation.get("source", "chat")
-        source_colors = {
-            "voice": (theme.success, "🎤"),
-            "text": (theme.info, "💬"),
-            "chat": (theme.primary, "💭"),
-        }
-        badge_color, badge_icon = source_colors.get(source,
-                                                    (theme.text_muted, "📝"))
-
-        source_badge = QLabel(f"{badge_icon} {source.upper()}")
-        source_badge.setStyleSheet(f"""
-            background-color: {badge_color}20;
-            color: {badge_color};
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 10px;
-            font-weight: 600;
-        """)
 
-        top_row.addWidget(time_label)
-        top_row.addStretch()
-        top_row.addWidget(source_badge)
+def _read_recent_conversations(path: str,
+                               limit: int) -> Tuple[List[dict], int]:
+    """
+    Read the last `limit` conversations from the history file, oldest
+    first, and the total number of conversations it holds. With ijson the
+    file is streamed, so only the kept conversations are ever built.
+    """
+    if IJSON_AVAILABLE:
+        recent = deque(maxlen=limit)
+        total = 0
+        with open(path, "rb") as f:
+            for conversation in ijson.items(f,
+                                            "conversations.item",
+                                            use_float=True):
+                recent.append(conversation)
+                total += 1
+        return list(recent), total
+
+    with open(path, "r", encoding="utf-8") as f:
+        conversations = json.load(f).get("conversations", [])
+    return conversations[-limit:], len(conversations)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: str, fmt: str) -> str:
+    """Format a conversation timestamp for display, or return it as-is."""
+    try:
+        return _parse_timestamp(timestamp).strftime(fmt)
+    except ValueError:
+        return timestamp
+
+
+def _card_text(conversation: dict) -> Tuple[str, str, str]:
+    """Timestamp, source badge and query preview text for a list card."""
+    time_display = _format_timestamp(
+        conversation.get("timestamp", "")[:16], "%b %d, %Y • %I:%M %p")
+    source = conversation.get("source", "chat")
+    badge_icon = _SOURCE_ICONS.get(source, "📝")
+    user_query = conversation.get("user_query", "")
+    if len(user_query) > 80:
+        user_query = user_query[:80] + "..."
+    return f"🕐 {time_display}", f"{badge_icon} {source.upper()}", user_query
+
+
+class ConversationListModel(QAbstractListModel):
+    """List model over conversation dicts, exposed under Qt.UserRole."""
+
+    # (timestamp, source badge, query preview) strings shown on the card
+    CardTextRole = Qt.UserRole + 1
 
-        layout.addLayout(top_row)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._conversations: List[dict] = []
+        # Card text per row, built the first time the row is painted
+        self._card_text: List[Optional[Tuple[str, str, str]]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._conversations)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        conversation = self._conversations[row]
+        if role == Qt.UserRole:
+            return conversation
+        if role == self.CardTextRole:
+            text = self._card_text[row]
+            if text is None:
+                text = self._card_text[row] = _card_text(conversation)
+            return text
+        if role == Qt.DisplayRole:
+            return conversation.get("user_query", "")
+        return None
+
+    def conversation(self, row: int) -> dict:
+        """
+        The conversation dict at row, by reference. data(Qt.UserRole)
+        converts it through a QVariant, copying the whole dict per call.
+        """
+        return self._conversations[row]
+
+    def set_conversations(self, conversations: List[dict]) -> bool:
+        """
+        Replace the listed conversations, keeping text already built.
+        Returns False, without resetting the view, if nothing changed.
+        """
+        if len(conversations) == len(self._conversations) and all(
+                new is old
+                for new, old in zip(conversations, self._conversations)):
+            return False
+
+        # Both lists are alive here, so id() cannot be reused in between
+        built = {
+            id(conversation): text
+            for conversation, text in zip(self._conversations,
+                                          self._card_text)
+            if text is not None
+        }
+        self.beginResetModel()
+        self._conversations = list(conversations)
+        self._card_text = [
+            built.get(id(conversation))
+            for conversation in self._conversations
+        ]
+        self.endResetModel()
+        return True
 
-        # Query preview
-        user_query = self.conversation.get("user_query", "")[:80]
-        if len(self.conversation.get("user_query", "")) > 80:
-            user_query += "..."
-
-        query_label = QLabel(user_query)
-        query_label.setWordWrap(True)
-        query_label.setStyleSheet(f"""
-            color: {theme.text_primary};
-            font-size: 13px;
-            font-weight: 500;
-            line-height: 1.4;
-        """)
 
-        layout.addWidget(query_label)
-        layout.addStretch()
+class ConversationDelegate(QStyledItemDelegate):
+    """
+    Paints each conversation as a card: timestamp, source badge and a
+    preview of the query. No widgets are created per row.
+    """
 
-    def _update_style(self, selected: bool):
-        """Update the card style based on selection state."""
-        theme = get_theme()
+    CARD_HEIGHT = 90
+    CARD_SPACING = 10
+    # Leaves room for the list's scrollbar
+    RIGHT_MARGIN = 8
+    RADIUS = 12
+    PADDING = (16, 12)
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._time_font = get_font(11, FONTS["weight_medium"])
+        self._badge_font = get_font(10, FONTS["weight_semibold"])
+        self._query_font = get_font(13, FONTS["weight_medium"])
+        self._badge_metrics = QFontMetrics(self._badge_font)
+        self._badge_widths = {}
+        self._theme_version = -1
+        self._apply_theme_colors()
+
+    def _apply_theme_colors(self):
+        theme = get_theme()
+        self._theme_version = theme_version()
+        self._bg = QColor(theme.bg_card)
+        self._bg_hover = QColor(theme.bg_tertiary)
+        self._border = QColor(theme.border)
+        self._border_hover = QColor(theme.primary)
+        self._border_hover.setAlpha(0x50)
+        self._bg_selected = QColor(theme.primary)
+        self._bg_selected.setAlpha(0x15)
+        self._bg_selected_hover = QColor(theme.primary)
+        self._bg_selected_hover.setAlpha(0x20)
+        self._border_selected = QColor(theme.primary)
+        self._time_color = QColor(theme.text_muted)
+        self._query_color = QColor(theme.text_primary)
+        self._source_colors = {
+            "voice": QColor(theme.success),
+            "text": QColor(theme.info),
+            "chat": QColor(theme.primary),
+        }
+        self._default_source_color = QColor(theme.text_muted)
+        # Translucent badge fills, so paint() does not copy a color per row
+        self._badge_bgs = {}
+        for source, color in self._source_colors.items():
+            self._badge_bgs[source] = QColor(color)
+            self._badge_bgs[source].setAlpha(0x20)
+        self._default_badge_bg = QColor(self._default_source_color)
+        self._default_badge_bg.setAlpha(0x20)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(),
+                     self.CARD_HEIGHT + self.CARD_SPACING)
+
+    def paint(self, painter: QPainter, option, index):
+        if self._theme_version != theme_version():
+            self._apply_theme_colors()
+
+        conversation = index.model().conversation(index.row())
+        time_text, badge_text, query_text = index.data(
+            ConversationListModel.CardTextRole)
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background
+        card = QRectF(option.rect.adjusted(0, 0, -self.RIGHT_MARGIN,
+                                           -self.CARD_SPACING))
         if selected:
-            self.setStyleSheet(f"""
-                ConversationCard {{
-                    background-color: {theme.primary}15;
-                    border: 2px solid {theme.primary};
-                    border-radius: 12px;
-                }}
-                ConversationCard:hover {{
-                    background-color: {theme.primary}20;
-                }}
-            """)
+            painter.setPen(self._border_selected)
+            painter.setBrush(
+                self._bg_selected_hover if hovered else self._bg_selected)
+            inset = 1.0
         else:
-            self.setStyleSheet(f"""
-                ConversationCard {{
-                    background-color: {theme.bg_card};
-                    border: 1px solid {theme.border};
-                    border-radius: 12px;
-                }}
-                ConversationCard:hover {{
-                    background-color: {theme.bg_tertiary};
-                    border-color: {theme.primary}50;
-                }}
-            """)
+            painter.setPen(self._border_hover if hovered else self._border)
+            painter.setBrush(self._bg_hover if hovered else self._bg)
+            inset = 0.5
+        pen = painter.pen()
+        pen.setWidthF(2 * inset)
+        painter.setPen(pen)
+        painter.drawRoundedRect(card.adjusted(inset, inset, -inset, -inset),
+                                self.RADIUS, self.RADIUS)
+
+        pad_x, pad_y = self.PADDING
+        content = card.toRect().adjusted(pad_x, pad_y, -pad_x, -pad_y)
+
+        # Source badge, right-aligned in the top row
+        source = conversation.get("source")
+        badge_color = self._source_colors.get(source,
+                                              self._default_source_color)
+        badge_w = self._badge_widths.get(badge_text)
+        if badge_w is None:
+            badge_w = self._badge_metrics.horizontalAdvance(badge_text) + 16
+            self._badge_widths[badge_text] = badge_w
+        badge_h = self._badge_metrics.height() + 4
+        badge = QRect(content.right() - badge_w + 1, content.top(), badge_w,
+                      badge_h)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._badge_bgs.get(source, self._default_badge_bg))
+        painter.drawRoundedRect(QRectF(badge), badge_h / 2, badge_h / 2)
+        painter.setFont(self._badge_font)
+        painter.setPen(badge_color)
+        painter.drawText(badge, Qt.AlignCenter, badge_text)
+
+        # Timestamp
+        time_rect = QRect(content.left(), content.top(),
+                          content.width() - badge_w - 8, badge_h)
+        painter.setFont(self._time_font)
+        painter.setPen(self._time_color)
+        painter.drawText(time_rect, Qt.AlignLeft | Qt.AlignVCenter, time_text)
 
-    def set_selected(self, selected: bool):
-        """Set the selection state."""
-        self.selected = selected
-        self._update_style(selected)
+        # Query preview
+        query_rect = content.adjusted(0, badge_h + 6, 0, 0)
+        painter.setFont(self._query_font)
+        painter.setPen(self._query_color)
+        painter.setClipRect(query_rect)
+        painter.drawText(query_rect, Qt.AlignLeft | Qt.AlignTop |
+                         Qt.TextWordWrap, query_text)
 
-    def mousePressEvent(self, event):
-        """Handle mouse press."""
-        self.clicked.emit(self.conversation)
-        super().mousePressEvent(event)
+        painter.restore()
 
 
 class ConversationDetailView(QFrame):
@@ -164,6 +352,7 @@ class ConversationDetailView(QFrame):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._conversation = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -246,12 +435,12 @@ class ConversationDetailView(QFrame):
 
         # User query section
         user_section = self._create_message_section(
-            "👤 You", theme.chat_user_bg, theme.chat_user_text, True)
+            theme, "👤 You", theme.chat_user_bg, theme.chat_user_text, True)
         self.user_query_label = user_section["content"]
         detail_layout.addWidget(user_section["widget"])
 
         # AI response section
-        ai_section = self._create_message_section("🤖 VocalXpert",
+        ai_section = self._create_message_section(theme, "🤖 VocalXpert",
                                                   theme.chat_bot_bg,
                                                   theme.text_primary, False)
         self.ai_response_label = ai_section["content"]
@@ -299,10 +488,9 @@ class ConversationDetailView(QFrame):
 
         layout.addWidget(self.stacked)
 
-    def _create_message_section(self, title: str, bg_color: str,
+    def _create_message_section(self, theme, title: str, bg_color: str,
                                 text_color: str, is_user: bool) -> dict:
         """Create a message section widget."""
-        theme = get_theme()
 
         section = QFrame()
         if is_user:
@@ -357,15 +545,15 @@ class ConversationDetailView(QFrame):
 
     def show_conversation(self, conversation: dict):
         """Display a conversation's details."""
-        theme = get_theme()
+        # Filtering reselects the first card; skip re-wrapping the same text
+        if conversation is self._conversation:
+            self.stacked.setCurrentIndex(1)
+            return
+        self._conversation = conversation
 
         # Parse timestamp
-        timestamp = conversation.get("timestamp", "")
-        try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            time_display = dt.strftime("%A, %B %d, %Y at %I:%M %p")
-        except BaseException:
-            time_display = timestamp
+        time_display = _format_timestamp(conversation.get("timestamp", ""),
+                                         "%A, %B %d, %Y at %I:%M %p")
 
         source = conversation.get("source", "chat")
         self.header_label.setText(
@@ -394,6 +582,36 @@ class ConversationDetailView(QFrame):
         self.stacked.setCurrentIndex(0)
 
 
+@lru_cache(maxsize=16)
+def _stats_card_qss(bg_card: str, border: str, text_muted: str,
+                    color: str) -> str:
+    """Stylesheet for a StatsCard and its labels, built once per colors."""
+    return f"""
+        StatsCard {{
+            background-color: {bg_card};
+            border: 1px solid {border};
+            border-radius: 12px;
+        }}
+        StatsCard:hover {{
+            border-color: {color};
+            background-color: {color}08;
+        }}
+        QLabel#statsIcon {{
+            font-size: 18px;
+        }}
+        QLabel#statsValue {{
+            color: {color};
+            font-size: 22px;
+            font-weight: 700;
+        }}
+        QLabel#statsLabel {{
+            color: {text_muted};
+            font-size: 11px;
+            font-weight: 500;
+        }}
+    """
+
+
 class StatsCard(QFrame):
     """A card displaying statistics."""
 
@@ -402,22 +620,15 @@ class StatsCard(QFrame):
                  value: str,
                  label: str,
                  color: str,
+                 theme: Optional[Theme] = None,
                  parent=None):
         super().__init__(parent)
-        theme = get_theme()
+        theme = theme or get_theme()
 
         self.setFixedSize(140, 90)
-        self.setStyleSheet(f"""
-            StatsCard {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 12px;
-            }}
-            StatsCard:hover {{
-                border-color: {color};
-                background-color: {color}08;
-            }}
-        """)
+        self.setStyleSheet(
+            _stats_card_qss(theme.bg_card, theme.border, theme.text_muted,
+                            color))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(14, 12, 14, 12)
@@ -429,30 +640,26 @@ class StatsCard(QFrame):
         value_row.setSpacing(8)
 
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 18px;")
+        icon_label.setObjectName("statsIcon")
 
-        value_label = QLabel(value)
-        value_label.setStyleSheet(f"""
-            color: {color};
-            font-size: 22px;
-            font-weight: 700;
-        """)
+        self.value_label = QLabel(value)
+        self.value_label.setObjectName("statsValue")
 
         value_row.addWidget(icon_label)
-        value_row.addWidget(value_label)
+        value_row.addWidget(self.value_label)
         value_row.addStretch()
 
         # Label
         label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"""
-            color: {theme.text_muted};
-            font-size: 11px;
-            font-weight: 500;
-        """)
+        label_widget.setObjectName("statsLabel")
 
         layout.addLayout(value_row)
         layout.addWidget(label_widget)
 
+    def set_value(self, value: str):
+        """Update the displayed statistic."""
+        self.value_label.setText(value)
+
 
 class HistoryPanel(QWidget):
     """
@@ -463,17 +670,38 @@ class HistoryPanel(QWidget):
         super().__init__(parent)
         self.history_data = []
         self.filtered_data = []
-        self.conversation_cards = []
-        self.selected_card = None
+        # Per-conversation case-folded "query\nresponse", source and parsed
+        # timestamp, parallel to history_data, so filtering does no
+        # per-keystroke string or date work
+        self._search_index: List[str] = []
+        self._source_index: List[str] = []
+        self._date_index: List[Optional[datetime]] = []
+        # (search text, source filter, date filter) -> matching row indexes
+        self._search_cache = OrderedDict()
+
+        # Coalesces a burst of search/filter edits into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._filter_conversations)
+
+        # Modification time of the history file as last loaded
+        self._history_mtime: Optional[float] = None
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(_RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self._load_history)
+
+        # Reload when the history file is written or (re)created
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_history_changed)
+        self._watcher.directoryChanged.connect(self._on_history_changed)
+        self._watch_history_file()
+
         self._setup_ui()
         self._load_history()
 
     def _setup_ui(self):
         """Build the history interface."""
-        theme = get_theme()
-
-        self.setStyleSheet(f"background-color: {theme.bg_primary};")
-
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -492,15 +720,8 @@ class HistoryPanel(QWidget):
 
     def _create_header(self) -> QWidget:
         """Create the modern history header."""
-        theme = get_theme()
-
         header = QFrame()
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.bg_secondary};
-                border-bottom: 1px solid {theme.border};
-            }}
-        """)
+        header.setObjectName("historyHeader")
 
         layout = QVBoxLayout(header)
         layout.setContentsMargins(SPACING["xl"], SPACING["lg"], SPACING["xl"],
@@ -515,17 +736,10 @@ class HistoryPanel(QWidget):
         title_section.setSpacing(4)
 
         title = QLabel("📚 Conversation History")
-        title.setStyleSheet(f"""
-            color: {theme.text_primary};
-            font-size: 24px;
-            font-weight: 700;
-        """)
+        title.setObjectName("historyTitle")
 
         subtitle = QLabel("Browse and search your past conversations")
-        subtitle.setStyleSheet(f"""
-            color: {theme.text_muted};
-            font-size: 13px;
-        """)
+        subtitle.setObjectName("historySubtitle")
 
         title_section.addWidget(title)
         title_section.addWidget(subtitle)
@@ -539,38 +753,11 @@ class HistoryPanel(QWidget):
 
         # Export button
         export_btn = QPushButton("📥 Export")
-        export_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.bg_tertiary};
-                color: {theme.text_secondary};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.bg_input};
-                border-color: {theme.primary}50;
-            }}
-        """)
+        export_btn.setObjectName("historyExportButton")
 
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.primary};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 20px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.primary_hover};
-            }}
-        """)
+        refresh_btn.setObjectName("historyRefreshButton")
         refresh_btn.clicked.connect(self._load_history)
 
         action_row.addWidget(export_btn)
@@ -586,60 +773,24 @@ class HistoryPanel(QWidget):
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search conversations...")
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {theme.bg_input};
-                border: 1px solid {theme.border};
-                border-radius: 10px;
-                padding: 10px 16px;
-                font-size: 13px;
-                color: {theme.text_primary};
-            }}
-            QLineEdit:focus {{
-                border-color: {theme.primary};
-            }}
-        """)
-        self.search_input.textChanged.connect(self._filter_conversations)
+        self.search_input.setObjectName("historySearch")
+        self.search_input.textChanged.connect(self._schedule_search)
 
         # Source filter
         self.source_filter = QComboBox()
         self.source_filter.addItems(
             ["All Sources", "💭 Chat", "🎤 Voice", "💬 Text"])
-        self.source_filter.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {theme.bg_input};
-                border: 1px solid {theme.border};
-                border-radius: 10px;
-                padding: 10px 16px;
-                font-size: 13px;
-                color: {theme.text_primary};
-                min-width: 130px;
-            }}
-            QComboBox:focus {{
-                border-color: {theme.primary};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                padding-right: 10px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                selection-background-color: {theme.primary}30;
-                color: {theme.text_primary};
-            }}
-        """)
+        self.source_filter.setProperty("class", "history-filter")
         self.source_filter.currentIndexChanged.connect(
-            self._filter_conversations)
+            self._schedule_filter)
 
         # Date filter
         self.date_filter = QComboBox()
         self.date_filter.addItems(
             ["All Time", "Today", "Last 7 Days", "Last 30 Days"])
-        self.date_filter.setStyleSheet(self.source_filter.styleSheet())
+        self.date_filter.setProperty("class", "history-filter")
         self.date_filter.currentIndexChanged.connect(
-            self._filter_conversations)
+            self._schedule_filter)
 
         filter_row.addWidget(self.search_input, 1)
         filter_row.addWidget(self.source_filter)
@@ -654,31 +805,33 @@ class HistoryPanel(QWidget):
         theme = get_theme()
 
         stats_bar = QFrame()
-        stats_bar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.bg_secondary};
-                border-bottom: 1px solid {theme.border};
-            }}
-        """)
+        stats_bar.setObjectName("historyStatsBar")
 
         layout = QHBoxLayout(stats_bar)
         layout.setContentsMargins(SPACING["xl"], SPACING["md"], SPACING["xl"],
                                   SPACING["md"])
         layout.setSpacing(16)
 
-        # Stats cards will be added dynamically
-        self.stats_container = QHBoxLayout()
-        self.stats_container.setSpacing(12)
+        # Stats cards; their values are filled in by _update_stats
+        self.total_stat = StatsCard("📊", "0", "Total Chats", theme.primary,
+                                    theme)
+        self.today_stat = StatsCard("📅", "0", "Today", theme.success, theme)
+        self.voice_stat = StatsCard("🎤", "0", "Voice", theme.warning, theme)
+        self.text_stat = StatsCard("💬", "0", "Text", theme.info, theme)
 
-        layout.addLayout(self.stats_container)
+        stats_row = QHBoxLayout()
+        stats_row.setSpacing(12)
+        for card in (self.total_stat, self.today_stat, self.voice_stat,
+                     self.text_stat):
+            stats_row.addWidget(card)
+
+        layout.addLayout(stats_row)
         layout.addStretch()
 
         return stats_bar
 
     def _create_content(self) -> QWidget:
         """Create the main content area with conversation list and details."""
-        theme = get_theme()
-
         content = QWidget()
         layout = QHBoxLayout(content)
         layout.setContentsMargins(SPACING["xl"], SPACING["lg"], SPACING["xl"],
@@ -689,13 +842,7 @@ class HistoryPanel(QWidget):
         left_panel = QFrame()
         left_panel.setMinimumWidth(360)
         left_panel.setMaximumWidth(420)
-        left_panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.bg_secondary};
-                border: 1px solid {theme.border};
-                border-radius: 16px;
-            }}
-        """)
+        left_panel.setObjectName("historyListPanel")
 
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(16, 16, 16, 16)
@@ -705,21 +852,10 @@ class HistoryPanel(QWidget):
         list_header = QHBoxLayout()
 
         self.list_title = QLabel("💬 Recent Conversations")
-        self.list_title.setStyleSheet(f"""
-            color: {theme.text_primary};
-            font-size: 14px;
-            font-weight: 600;
-        """)
+        self.list_title.setObjectName("historyListTitle")
 
         self.count_badge = QLabel("0")
-        self.count_badge.setStyleSheet(f"""
-            background-color: {theme.primary}20;
-            color: {theme.primary};
-            padding: 2px 10px;
-            border-radius: 10px;
-            font-size: 12px;
-            font-weight: 600;
-        """)
+        self.count_badge.setObjectName("historyCountBadge")
 
         list_header.addWidget(self.list_title)
         list_header.addStretch()
@@ -727,41 +863,26 @@ class HistoryPanel(QWidget):
 
         left_layout.addLayout(list_header)
 
-        # Scrollable conversation list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background-color: {theme.bg_tertiary};
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {theme.border_light};
-                border-radius: 4px;
-                min-height: 40px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {theme.primary};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-            }}
-        """)
-
-        self.list_container = QWidget()
-        self.list_layout = QVBoxLayout(self.list_container)
-        self.list_layout.setContentsMargins(0, 0, 8, 0)
-        self.list_layout.setSpacing(10)
-        self.list_layout.setAlignment(Qt.AlignTop)
-
-        scroll_area.setWidget(self.list_container)
-        left_layout.addWidget(scroll_area)
+        # Conversation list; rows are painted by the delegate
+        self.list_model = ConversationListModel(self)
+        self.list_view = QListView()
+        self.list_view.setObjectName("historyList")
+        self.list_view.setModel(self.list_model)
+        self.list_view.setItemDelegate(ConversationDelegate(self.list_view))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setMouseTracking(True)
+        self.list_view.viewport().setAttribute(Qt.WA_Hover)
+        self.list_view.viewport().setCursor(Qt.PointingHandCursor)
+        self.list_view.selectionModel().currentRowChanged.connect(
+            self._on_current_changed)
+
+        self.list_empty_state = self._create_list_empty_state()
+
+        left_layout.addWidget(self.list_view, 1)
+        left_layout.addWidget(self.list_empty_state, 1)
 
         # Right panel: Conversation details
         self.detail_view = ConversationDetailView()
@@ -771,218 +892,216 @@ class HistoryPanel(QWidget):
 
         return content
 
+    def _watch_history_file(self):
+        """Watch the history file and its folder, whichever exist."""
+        watched = set(self._watcher.files() + self._watcher.directories())
+        for path in (_HISTORY_FILE, os.path.dirname(_HISTORY_FILE)):
+            if path not in watched and os.path.exists(path):
+                self._watcher.addPath(path)
+
+    @Slot(str)
+    def _on_history_changed(self, path: str):
+        """Schedule a reload after the history file changes."""
+        # A file replaced on disk drops out of the watcher; add it back
+        self._watch_history_file()
+        self._reload_timer.start()
+
     def _load_history(self):
-        """Load conversation history from JSON file."""
+        """Load conversation history from JSON file, if it changed."""
         try:
-            history_file = os.path.join(
-                "userData", "conversation_history.json")
-
-            if not os.path.exists(history_file):
+            if not os.path.exists(_HISTORY_FILE):
+                self._history_mtime = None
                 self._show_empty_state()
                 return
 
-            with open(history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime = os.path.getmtime(_HISTORY_FILE)
+            if mtime == self._history_mtime:
+                return
 
-            conversations = data.get("conversations", [])
+            recent, total_count = _read_recent_conversations(
+                _HISTORY_FILE, _HISTORY_LIMIT)
             # Reverse to show newest first
-            self.history_data = list(reversed(conversations[-100:]))
-            self.filtered_data = self.history_data.copy()
+            self.history_data = recent[::-1]
+            self._build_search_index()
+            self._history_mtime = mtime
 
-            # Update UI
-            self._update_conversation_list()
-            self._update_stats(data.get("metadata", {}), len(conversations))
+            # Update UI, keeping the current search and filters
+            self._filter_conversations()
+            self._update_stats(total_count)
 
         except Exception as e:
             self._show_error_state(f"Error loading history: {str(e)}")
 
-    def _update_conversation_list(self):
-        """Update the conversation list with current filtered data."""
-        theme = get_theme()
+    def _create_list_empty_state(self) -> QWidget:
+        """Create the placeholder shown when no conversation matches."""
+        empty_widget = QWidget()
+        empty_layout = QVBoxLayout(empty_widget)
+        empty_layout.setAlignment(Qt.AlignCenter)
 
-        # Clear existing cards
-        for card in self.conversation_cards:
-            card.deleteLater()
-        self.conversation_cards.clear()
-        self.selected_card = None
-
-        # Clear layout
-        while self.list_layout.count():
-            item = self.list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if not self.filtered_data:
-            # Show empty state in list
-            empty_widget = QWidget()
-            empty_layout = QVBoxLayout(empty_widget)
-            empty_layout.setAlignment(Qt.AlignCenter)
-
-            empty_icon = QLabel("🔍")
-            empty_icon.setStyleSheet("font-size: 32px;")
-            empty_icon.setAlignment(Qt.AlignCenter)
-
-            empty_label = QLabel("No conversations found")
-            empty_label.setStyleSheet(f"""
-                color: {theme.text_muted};
-                font-size: 13px;
-            """)
-            empty_label.setAlignment(Qt.AlignCenter)
+        empty_icon = QLabel("🔍")
+        empty_icon.setObjectName("historyEmptyIcon")
+        empty_icon.setAlignment(Qt.AlignCenter)
 
-            empty_hint = QLabel("Try adjusting your filters")
-            empty_hint.setStyleSheet(f"""
-                color: {theme.text_muted};
-                font-size: 11px;
-            """)
-            empty_hint.setAlignment(Qt.AlignCenter)
+        empty_label = QLabel("No conversations found")
+        empty_label.setObjectName("historyEmptyText")
+        empty_label.setAlignment(Qt.AlignCenter)
+
+        empty_hint = QLabel("Try adjusting your filters")
+        empty_hint.setObjectName("historyEmptyHint")
+        empty_hint.setAlignment(Qt.AlignCenter)
 
-            empty_layout.addSpacing(40)
-            empty_layout.addWidget(empty_icon)
-            empty_layout.addWidget(empty_label)
-            empty_layout.addWidget(empty_hint)
-            empty_layout.addStretch()
+        empty_layout.addSpacing(40)
+        empty_layout.addWidget(empty_icon)
+        empty_layout.addWidget(empty_label)
+        empty_layout.addWidget(empty_hint)
+        empty_layout.addStretch()
+
+        empty_widget.hide()
+        return empty_widget
+
+    def _update_conversation_list(self):
+        """Update the conversation list with current filtered data."""
+        count = len(self.filtered_data)
+        changed = self.list_model.set_conversations(self.filtered_data)
 
-            self.list_layout.addWidget(empty_widget)
+        self.list_view.setVisible(bool(count))
+        self.list_empty_state.setVisible(not count)
+        self.count_badge.setText(str(count))
+
+        if not count:
             self.detail_view.show_empty()
-            self.count_badge.setText("0")
             return
 
-        # Add conversation cards
-        for i, conv in enumerate(self.filtered_data):
-            card = ConversationCard(conv)
-            card.clicked.connect(self._on_conversation_selected)
-            self.conversation_cards.append(card)
-            self.list_layout.addWidget(card)
-
-            # Select first card by default
-            if i == 0:
-                card.set_selected(True)
-                self.selected_card = card
-                self.detail_view.show_conversation(conv)
-
-        self.list_layout.addStretch()
-        self.count_badge.setText(str(len(self.filtered_data)))
-
-    def _on_conversation_selected(self, conversation: dict):
-        """Handle conversation selection."""
-        # Find and update the selected card
-        for card in self.conversation_cards:
-            if card.conversation == conversation:
-                if self.selected_card:
-                    self.selected_card.set_selected(False)
-                card.set_selected(True)
-                self.selected_card = card
-                break
-
-        self.detail_view.show_conversation(conversation)
-
+        # Select first conversation by default; the same rows as before
+        # keep their selection and scroll position
+        if changed:
+            self.list_view.setCurrentIndex(self.list_model.index(0))
+            self.list_view.scrollToTop()
+
+    @Slot(QModelIndex, QModelIndex)
+    def _on_current_changed(self, current: QModelIndex,
+                            previous: QModelIndex):
+        """Show the details of the newly selected conversation."""
+        if current.isValid():
+            self.detail_view.show_conversation(
+                self.list_model.conversation(current.row()))
+
+    @Slot(str)
+    def _schedule_search(self, text: str):
+        """Re-filter once the user pauses typing."""
+        self._filter_timer.start(_SEARCH_DEBOUNCE_MS)
+
+    @Slot(int)
+    def _schedule_filter(self, index: int):
+        """Re-filter shortly after a filter combo changes."""
+        self._filter_timer.start(_FILTER_DEBOUNCE_MS)
+
+    @Slot()
     def _filter_conversations(self):
         """Filter conversations based on search and filter criteria."""
-        search_text = self.search_input.text().lower()
+        search_text = self.search_input.text().casefold()
         source_filter = self.source_filter.currentText()
         date_filter = self.date_filter.currentText()
 
-        self.filtered_data = []
-
-        for conv in self.history_data:
-            # Search filter
-            if search_text:
-                query = conv.get("user_query", "").lower()
-                response = conv.get("ai_response", "").lower()
-                if search_text not in query and search_text not in response:
-                    continue
-
-            # Source filter
-            if source_filter != "All Sources":
-                source = conv.get("source", "")
-                if source_filter == "💭 Chat" and source != "chat":
-                    continue
-                elif source_filter == "🎤 Voice" and source != "voice":
-                    continue
-                elif source_filter == "💬 Text" and source != "text":
-                    continue
-
-            # Date filter
-            if date_filter != "All Time":
-                try:
-                    timestamp = conv.get("timestamp", "")
-                    conv_date = datetime.fromisoformat(
-                        timestamp.replace("Z", "+00:00"))
-                    now = datetime.now()
-
-                    if date_filter == "Today":
-                        if conv_date.date() != now.date():
-                            continue
-                    elif date_filter == "Last 7 Days":
-                        if (now - conv_date).days > 7:
-                            continue
-                    elif date_filter == "Last 30 Days":
-                        if (now - conv_date).days > 30:
-                            continue
-                except BaseException:
-                    pass
-
-            self.filtered_data.append(conv)
+        key = (search_text, source_filter, date_filter)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            self.filtered_data = [self.history_data[i] for i in cached]
+            self._update_conversation_list()
+            return
 
+        # A longer query only narrows the matches of a cached prefix of it
+        rows = range(len(self.history_data))
+        prefix_len = -1
+        for text, source, date in self._search_cache:
+            if (source == source_filter and date == date_filter and
+                    len(text) > prefix_len and search_text.startswith(text)):
+                rows = self._search_cache[(text, source, date)]
+                prefix_len = len(text)
+
+        search_index = self._search_index
+        if search_text:
+            rows = [i for i in rows if search_text in search_index[i]]
+
+        wanted_source = _SOURCE_FILTERS.get(source_filter)
+        if wanted_source is not None:
+            source_index = self._source_index
+            rows = [i for i in rows if source_index[i] == wanted_source]
+
+        # Date filter; conversations without a valid timestamp always pass
+        if date_filter != "All Time":
+            date_index = self._date_index
+            now = datetime.now()
+            if date_filter == "Today":
+                today = now.date()
+                rows = [
+                    i for i in rows if date_index[i] is None or
+                    date_index[i].date() == today
+                ]
+            elif date_filter in _DATE_WINDOWS:
+                # (now - date).days <= N  <=>  date > now - (N + 1) days
+                cutoff = now - timedelta(days=_DATE_WINDOWS[date_filter] + 1)
+                rows = [
+                    i for i in rows
+                    if date_index[i] is None or date_index[i] > cutoff
+                ]
+
+        matches = tuple(rows)
+        self._search_cache[key] = matches
+        if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
+        self.filtered_data = [self.history_data[i] for i in matches]
         self._update_conversation_list()
 
-    def _update_stats(self, metadata: dict, total_count: int):
-        """Update statistics display."""
-        theme = get_theme()
-
-        # Clear existing stats
-        while self.stats_container.count():
-            item = self.stats_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Calculate stats
-        total_convs = total_count
-
-        # Count by source
-        voice_count = sum(
-            1 for c in self.history_data if c.get("source") == "voice")
-        text_count = sum(
-            1 for c in self.history_data if c.get("source") in [
-                "text", "chat"])
-
-        # Today's count
-        today = datetime.now().date()
-        today_count = 0
-        for conv in self.history_data:
-            try:
-                timestamp = conv.get("timestamp", "")
-                conv_date = datetime.fromisoformat(
-                    timestamp.replace("Z", "+00:00")).date()
-                if conv_date == today:
-                    today_count += 1
-            except BaseException:
-                pass
-
-        # Add stats cards
-        stats = [
-            ("📊", str(total_convs), "Total Chats", theme.primary),
-            ("📅", str(today_count), "Today", theme.success),
-            ("🎤", str(voice_count), "Voice", theme.warning),
-            ("💬", str(text_count), "Text", theme.info),
+    def _build_search_index(self):
+        """Rebuild the search side tables after history_data changes."""
+        self._search_index = [
+            (conv.get("user_query", "") + "\n" +
+             conv.get("ai_response", "")).casefold()
+            for conv in self.history_data
+        ]
+        self._source_index = [
+            conv.get("source", "") for conv in self.history_data
+        ]
+        self._date_index = [
+            _local_datetime(conv.get("timestamp", ""))
+            for conv in self.history_data
         ]
+        self._search_cache.clear()
 
-        for icon, value, label, color in stats:
-            card = StatsCard(icon, value, label, color)
-            self.stats_container.addWidget(card)
+    def _update_stats(self, total_count: int):
+        """Update statistics display."""
+        # Count by source and today's conversations in a single pass
+        today = datetime.now().date()
+        voice_count = text_count = today_count = 0
+        for source, conv_date in zip(self._source_index, self._date_index):
+            if source == "voice":
+                voice_count += 1
+            elif source in ("text", "chat"):
+                text_count += 1
+            if conv_date is not None and conv_date.date() == today:
+                today_count += 1
+
+        self.total_stat.set_value(str(total_count))
+        self.today_stat.set_value(str(today_count))
+        self.voice_stat.set_value(str(voice_count))
+        self.text_stat.set_value(str(text_count))
 
     def _show_empty_state(self):
         """Show empty state when no history is available."""
         self.history_data = []
         self.filtered_data = []
+        self._build_search_index()
         self._update_conversation_list()
-        self._update_stats({}, 0)
+        self._update_stats(0)
 
     def _show_error_state(self, error_msg: str):
         """Show error state."""
-        theme = get_theme()
         self.history_data = []
         self.filtered_data = []
+        self._build_search_index()
         self._update_conversation_list()
 
         # Show error in detail view
@@ -6,16 +6,18 @@ Modern login screen with face recognition integration.
 
 import sys
 import os
+import json
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 
-# Try to import OpenCV for face detection
-try:
-    import cv2
+import numpy as np
 
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
+# OpenCV is only needed for face registration; it is imported on first use
+# by _ensure_cv2() so app startup does not load it. None means not tried.
+cv2 = None
+CV2_AVAILABLE = None
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -41,6 +43,51 @@ from .components import Card, IconButton
 
 logger = logging.getLogger("VocalXpert.Login")
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_USER_DATA_DIR = _PROJECT_ROOT / "userData"
+_MODEL_PATH = _USER_DATA_DIR / "trainer.yml"
+_USER_PATH = _USER_DATA_DIR / "userData.pck"
+
+# Face detection runs on frames downscaled to at most this width, on one
+# frame in every _DETECT_EVERY; the preview keeps the last boxes in between
+_DETECTION_WIDTH = 320
+_DETECT_EVERY = 2
+# Consecutive failed reads (~30ms apart) before the camera counts as lost
+_MAX_READ_FAILURES = 100
+
+
+def _ensure_cv2() -> bool:
+    """Import OpenCV on first call; return whether it is available."""
+    global cv2, CV2_AVAILABLE
+
+    if CV2_AVAILABLE is None:
+        try:
+            import cv2 as _cv2
+
+            cv2 = _cv2
+            CV2_AVAILABLE = True
+        except ImportError:
+            CV2_AVAILABLE = False
+    return CV2_AVAILABLE
+
+
+# Face samples whose dHash differs from an earlier sample's by fewer bits
+# than this are near-duplicates and are not kept
+_MIN_SAMPLE_DISTANCE = 5
+
+
+def _dhash(image) -> int:
+    """64-bit difference hash of a grayscale image."""
+    small = cv2.resize(image, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(small[:, 1:] > small[:, :-1])
+    return int.from_bytes(bits.tobytes(), "big")
+
+
+@lru_cache(maxsize=1)
+def _load_face_classifier(cascade_path: str):
+    """Load the Haar face cascade once; reopening the dialog reuses it."""
+    return cv2.CascadeClassifier(cascade_path)
+
 
 class FaceRecognitionWorker(QThread):
     """Background thread for face recognition."""
@@ -61,12 +108,11 @@ class FaceRecognitionWorker(QThread):
             self.progress.emit(10)
 
             # Add project root to path
-            project_root = Path(__file__).parent.parent
-            sys.path.insert(0, str(project_root))
+            if str(_PROJECT_ROOT) not in sys.path:
+                sys.path.insert(0, str(_PROJECT_ROOT))
 
             # Check if model exists
-            model_path = project_root / "userData" / "trainer.yml"
-            if not model_path.exists():
+            if not _MODEL_PATH.exists():
                 self.status_changed.emit("❌ No face data found", "error")
                 self.finished.emit(False, "")
                 return
@@ -110,6 +156,105 @@ class FaceRecognitionWorker(QThread):
         self._is_running = False
 
 
+class FaceCaptureWorker(QThread):
+    """Background thread that reads the camera and detects faces."""
+
+    # Emitted when a new frame is waiting in the slot; fetch it with
+    # take_frame(). Frames the GUI has not taken yet are overwritten, so a
+    # slow GUI never builds a backlog of queued frames.
+    frame_ready = Signal()
+    error_occurred = Signal(str)
+
+    def __init__(self, face_classifier=None):
+        super().__init__()
+        self.face_classifier = face_classifier
+        self._is_running = True
+        self._lock = threading.Lock()
+        self._latest = None
+
+    def run(self):
+        """Capture frames until stopped."""
+        camera = cv2.VideoCapture(0)
+        try:
+            if not camera.isOpened():
+                self.error_occurred.emit("Cannot access camera")
+                return
+
+            # Ask for MJPG to cut USB bandwidth, and keep a single buffered
+            # frame so the preview shows the latest one instead of a backlog
+            camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            frame_count = 0
+            read_failures = 0
+            faces = ()
+            while self._is_running:
+                ret, frame = camera.read()
+                if not ret:
+                    read_failures += 1
+                    if read_failures >= _MAX_READ_FAILURES:
+                        self.error_occurred.emit("Camera stopped responding")
+                        return
+                    self.msleep(30)
+                    continue
+                read_failures = 0
+
+                face_rois = []
+                if (self.face_classifier is not None and
+                        frame_count % _DETECT_EVERY == 0):
+                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                    faces = self._detect_faces(gray)
+                    for x, y, w, h in faces:
+                        face_rois.append(
+                            cv2.resize(gray[y:y + h, x:x + w], (200, 200)))
+                frame_count += 1
+
+                # Draw rectangles around faces
+                for x, y, w, h in faces:
+                    cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0),
+                                  2)
+
+                with self._lock:
+                    pending = self._latest is not None
+                    self._latest = (frame, face_rois)
+                if not pending:
+                    self.frame_ready.emit()
+
+        except Exception as e:
+            logger.error(f"Camera capture error: {e}")
+            self.error_occurred.emit(str(e))
+        finally:
+            camera.release()
+
+    def _detect_faces(self, gray):
+        """Detect faces on a downscaled copy; boxes are in gray's pixels."""
+        height, width = gray.shape
+        scale = max(1.0, width / _DETECTION_WIDTH)
+        small = gray
+        if scale > 1:
+            small = cv2.resize(
+                gray, (round(width / scale), round(height / scale)),
+                interpolation=cv2.INTER_AREA)
+        min_size = max(1, round(30 / scale))
+        faces = self.face_classifier.detectMultiScale(
+            small, scaleFactor=1.3, minNeighbors=5,
+            minSize=(min_size, min_size))
+        return [(round(x * scale), round(y * scale),
+                 round(w * scale), round(h * scale))
+                for x, y, w, h in faces]
+
+    def take_frame(self):
+        """Return and clear the latest (BGR frame, 200x200 face ROIs)."""
+        with self._lock:
+            latest, self._latest = self._latest, None
+        return latest
+
+    def stop(self):
+        self._is_running = False
+
+
 class FaceRegistrationDialog(QDialog):
     """Dialog for registering new users with face recognition."""
 
@@ -121,14 +266,20 @@ class FaceRegistrationDialog(QDialog):
         self.setModal(True)
         self.resize(800, 600)
 
-        # Camera variables
-        self.camera = None
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._update_camera)
+        # Camera capture and face detection run in this worker thread
+        self.capture_worker = None
+        # Preview frames are resized into one reused buffer, wrapped once
+        # by _preview_image; both are replaced when the label size changes
+        self._preview_buf = None
+        self._preview_image = None
 
         # Face detection variables
         self.face_classifier = None
-        self.face_samples = []
+        # Samples are written into one preallocated (max_samples, 200, 200)
+        # array; only the first _n_samples rows are filled
+        self.face_samples = None
+        self._n_samples = 0
+        self._sample_hashes = []
         self.max_samples = 50
         self.user_name = ""
 
@@ -206,29 +357,22 @@ class FaceRegistrationDialog(QDialog):
 
     def _load_face_detector(self):
         """Load the face detection classifier."""
-        if not CV2_AVAILABLE:
+        if not _ensure_cv2():
             self.status_label.setText("❌ OpenCV not available")
             self.start_btn.setEnabled(False)
             return
 
-        cascade_path = (Path(__file__).parent.parent / "Cascade" /
+        cascade_path = (_PROJECT_ROOT / "Cascade" /
                         "haarcascade_frontalface_default.xml")
         if cascade_path.exists():
-            self.face_classifier = cv2.CascadeClassifier(str(cascade_path))
+            self.face_classifier = _load_face_classifier(str(cascade_path))
         else:
             self.status_label.setText("❌ Face detection model not found")
             self.start_btn.setEnabled(False)
 
     def _start_registration(self):
         """Start the face registration process."""
-        self.user_name = self.name_input.text().strip()
-        if not self.user_name:
-            self.status_label.setText("❌ Please enter your name")
-            return
-
-    def _start_registration(self):
-        """Start the face registration process."""
-        if not CV2_AVAILABLE:
+        if not _ensure_cv2():
             self.status_label.setText("❌ OpenCV not available")
             return
 
@@ -237,85 +381,85 @@ class FaceRegistrationDialog(QDialog):
             self.status_label.setText("❌ Please enter your name")
             return
 
-        # Initialize camera
-        try:
-            self.camera = cv2.VideoCapture(0)
-            if not self.camera.isOpened():
-                raise Exception("Cannot access camera")
-
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-            self.face_samples = []
-            self.progress_bar.setValue(0)
-            self.status_label.setText(
-                "📸 Position your face in the camera and hold still...")
-            self.start_btn.setText("Stop & Train")
-            self.start_btn.clicked.disconnect()
-            self.start_btn.clicked.connect(self._stop_and_train)
-
-            self.timer.start(30)  # 30ms = ~33 FPS
-
-        except Exception as e:
-            self.status_label.setText(f"❌ Camera error: {str(e)}")
+        # Start camera capture; retries refill the same sample buffer
+        if self.face_samples is None:
+            self.face_samples = np.empty((self.max_samples, 200, 200),
+                                         np.uint8)
+        self._n_samples = 0
+        self._sample_hashes = []
+        self.progress_bar.setValue(0)
+        self.status_label.setText(
+            "📸 Position your face in the camera and turn it slowly...")
+        self.start_btn.setText("Stop & Train")
+        self.start_btn.clicked.disconnect()
+        self.start_btn.clicked.connect(self._stop_and_train)
+
+        self.capture_worker = FaceCaptureWorker(self.face_classifier)
+        self.capture_worker.frame_ready.connect(self._on_frame_ready)
+        self.capture_worker.error_occurred.connect(self._on_camera_error)
+        self.capture_worker.start()
+
+    def _stop_capture(self):
+        """Stop the camera capture thread, if running."""
+        if self.capture_worker is not None:
+            self.capture_worker.stop()
+            self.capture_worker.wait()
+            self.capture_worker = None
+
+    def _on_camera_error(self, message: str):
+        """Handle a camera failure in the capture thread."""
+        self._stop_capture()
+        self.status_label.setText(f"❌ Camera error: {message}")
+        self.start_btn.setText("Start Registration")
+        self.start_btn.clicked.disconnect()
+        self.start_btn.clicked.connect(self._start_registration)
 
-    def _update_camera(self):
-        """Update camera preview and capture faces."""
-        if self.camera is None:
+    def _on_frame_ready(self):
+        """Update camera preview and keep the detected face samples."""
+        if self.capture_worker is None:
+            return  # Signal queued before capture was stopped
+        latest = self.capture_worker.take_frame()
+        if latest is None:
             return
+        frame, face_rois = latest
 
         try:
-            ret, frame = self.camera.read()
-            if not ret:
-                return
-
-            # Detect faces
-            if self.face_classifier is not None:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                faces = self.face_classifier.detectMultiScale(gray,
-                                                              scaleFactor=1.3,
-                                                              minNeighbors=5,
-                                                              minSize=(30, 30))
-
-                # Draw rectangles around faces
-                for x, y, w, h in faces:
-                    cv2.rectangle(
-                        frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-
-                    # Capture face sample if we haven't reached the limit
-                    if len(self.face_samples) < self.max_samples:
-                        face_roi = gray[y:y + h, x:x + w]
-                        face_roi = cv2.resize(face_roi, (200, 200))
-                        self.face_samples.append(face_roi)
-
-                        # Update progress
-                        progress = int(
-                            (len(self.face_samples) / self.max_samples) * 100)
-                        self.progress_bar.setValue(progress)
-
-                        if len(self.face_samples) >= self.max_samples:
-                            self.status_label.setText(
-                                "✅ Enough samples collected! Click 'Stop & Train'"
-                            )
-                            break
-
-            # Convert to Qt format and display
-            rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_image.data, w, h, bytes_per_line,
-                              QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qt_image)
-
-            # Scale to fit label while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(self.camera_label.size(),
-                                          Qt.KeepAspectRatio,
-                                          Qt.SmoothTransformation)
-            self.camera_label.setPixmap(scaled_pixmap)
+            # Capture face samples if we haven't reached the limit,
+            # skipping near-duplicates of samples already taken
+            for face_roi in face_rois:
+                if self._n_samples >= self.max_samples:
+                    break
+                sample_hash = _dhash(face_roi)
+                if any(
+                        bin(sample_hash ^ taken).count("1") <
+                        _MIN_SAMPLE_DISTANCE
+                        for taken in self._sample_hashes):
+                    continue
+                self.face_samples[self._n_samples] = face_roi
+                self._n_samples += 1
+                self._sample_hashes.append(sample_hash)
+
+            # Update progress
+            if face_rois:
+                progress = int(
+                    (self._n_samples / self.max_samples) * 100)
+                self.progress_bar.setValue(progress)
+
+            # Scale to fit label while maintaining aspect ratio; OpenCV
+            # resamples the frame so Qt only wraps a preview-sized image.
+            # Samples keep accumulating while the dialog is hidden or
+            # minimized, but nothing is drawn
+            if self.isVisible() and not self.isMinimized():
+                h, w = frame.shape[:2]
+                scale = min(self.camera_label.width() / w,
+                            self.camera_label.height() / h)
+                if scale > 0:
+                    w, h = max(1, int(w * scale)), max(1, int(h * scale))
+                self._update_preview(frame, w, h, scale < 1)
 
             # Update status
-            samples_text = f"Captured: {len(self.face_samples)}/{self.max_samples}"
-            if len(self.face_samples) < self.max_samples:
+            samples_text = f"Captured: {self._n_samples}/{self.max_samples}"
+            if self._n_samples < self.max_samples:
                 self.status_label.setText(
                     f"📸 {samples_text} - Keep your face in frame")
             else:
@@ -325,17 +469,32 @@ class FaceRegistrationDialog(QDialog):
         except Exception as e:
             logger.error(f"Camera update error: {e}")
 
+    def _update_preview(self, frame, width: int, height: int, shrink: bool):
+        """Resize frame into the reused preview buffer and show it."""
+        interpolation = cv2.INTER_AREA if shrink else cv2.INTER_LINEAR
+        if (self._preview_buf is None or
+                self._preview_buf.shape[:2] != (height, width)):
+            self._preview_buf = cv2.resize(frame, (width, height),
+                                           interpolation=interpolation)
+            # BGR888 wraps the OpenCV buffer as-is (no color conversion)
+            self._preview_image = QImage(self._preview_buf.data, width,
+                                         height, self._preview_buf.strides[0],
+                                         QImage.Format_BGR888)
+        elif frame.shape[:2] == (height, width):
+            self._preview_buf[...] = frame
+        else:
+            cv2.resize(frame, (width, height),
+                       dst=self._preview_buf,
+                       interpolation=interpolation)
+        self.camera_label.setPixmap(QPixmap.fromImage(self._preview_image))
+
     def _stop_and_train(self):
         """Stop capturing and train the model."""
-        self.timer.stop()
+        self._stop_capture()
 
-        if self.camera:
-            self.camera.release()
-            self.camera = None
-
-        if len(self.face_samples) < 10:
+        if self._n_samples < 10:
             self.status_label.setText(
-                f"❌ Not enough samples ({len(self.face_samples)}). Need at least 10."
+                f"❌ Not enough samples ({self._n_samples}). Need at least 10."
             )
             return
 
@@ -343,8 +502,8 @@ class FaceRegistrationDialog(QDialog):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
 
         # Train in background thread
-        self.training_thread = FaceTrainingWorker(self.face_samples,
-                                                  self.user_name)
+        self.training_thread = FaceTrainingWorker(
+            self.face_samples[:self._n_samples], self.user_name)
         self.training_thread.finished.connect(self._on_training_complete)
         self.training_thread.start()
 
@@ -365,11 +524,14 @@ class FaceRegistrationDialog(QDialog):
             self.start_btn.clicked.disconnect()
             self.start_btn.clicked.connect(self._start_registration)
 
+    def done(self, result):
+        """Stop the camera when the dialog is accepted or rejected."""
+        self._stop_capture()
+        super().done(result)
+
     def closeEvent(self, event):
         """Clean up on close."""
-        self.timer.stop()
-        if self.camera:
-            self.camera.release()
+        self._stop_capture()
         event.accept()
 
 
@@ -385,33 +547,33 @@ class FaceTrainingWorker(QThread):
 
     def run(self):
         """Train the face recognition model."""
-        if not CV2_AVAILABLE:
+        if not _ensure_cv2():
             self.finished.emit(False, "OpenCV not available")
             return
 
         try:
-            import numpy as np
-
             # Create userData directory
-            user_data_dir = Path(__file__).parent.parent / "userData"
-            user_data_dir.mkdir(exist_ok=True)
+            _USER_DATA_DIR.mkdir(exist_ok=True)
 
             # Train the model
             recognizer = cv2.face.LBPHFaceRecognizer_create()
-            labels = [0] * len(self.face_samples)  # User ID 0 for first user
-
-            recognizer.train(self.face_samples, np.array(labels))
+            # User ID 0 for first user
+            labels = np.zeros(len(self.face_samples), np.int32)
 
-            # Save the model
-            model_path = user_data_dir / "trainer.yml"
-            recognizer.save(str(model_path))
+            # face_samples is one (N, 200, 200) array, trained without
+            # stacking a list of images first
+            recognizer.train(self.face_samples, labels)
 
-            # Save user name
-            user_data_path = user_data_dir / "userData.pck"
-            import pickle
+            # Save the model and user name to temporary files first and
+            # swap them in, so a crash mid-write never leaves a torn file
+            model_tmp = _MODEL_PATH.with_name("trainer.tmp.yml")
+            recognizer.save(str(model_tmp))
+            os.replace(model_tmp, _MODEL_PATH)
 
-            with open(user_data_path, "wb") as f:
-                pickle.dump({"name": self.user_name}, f)
+            user_tmp = _USER_PATH.with_name(_USER_PATH.name + ".tmp")
+            with open(user_tmp, "w", encoding="utf-8") as f:
+                json.dump({"name": self.user_name}, f, ensure_ascii=False)
+            os.replace(user_tmp, _USER_PATH)
 
             self.finished.emit(True, "Model trained successfully")
 
@@ -448,8 +610,7 @@ class LoginWindow(QMainWindow):
         self.move(x, y)
 
         # Try to set icon
-        icon_path = (Path(__file__).parent.parent / "assets" / "images" /
-                     "assistant2.ico")
+        icon_path = _PROJECT_ROOT / "assets" / "images" / "assistant2.ico"
         if icon_path.exists():
             self.setWindowIcon(QIcon(str(icon_path)))
 
@@ -569,11 +730,7 @@ class LoginWindow(QMainWindow):
 
     def _check_user_data(self):
         """Check if user data exists and update UI accordingly."""
-        model_path = Path(__file__).parent.parent / "userData" / "trainer.yml"
-        user_data_path = Path(
-            __file__).parent.parent / "userData" / "userData.pck"
-
-        if not model_path.exists() or not user_data_path.exists():
+        if not _MODEL_PATH.exists() or not _USER_PATH.exists():
             self.status_label.setText(
                 "Welcome! No user registered yet. Please register your face first."
             )
@@ -619,9 +776,7 @@ class LoginWindow(QMainWindow):
             self.progress_bar.hide()
 
             # Check if it's because no face data exists
-            model_path = Path(
-                __file__).parent.parent / "userData" / "trainer.yml"
-            if not model_path.exists():
+            if not _MODEL_PATH.exists():
                 self.login_btn.setText("🔓  Login with Face ID")
                 self.status_label.setText(
                     "No face data found. Please register first using 'Register Face' below."
@@ -640,7 +795,7 @@ class LoginWindow(QMainWindow):
         self.login_successful.emit(user_name)
 
         # Small delay to show success message
-        QTimer.singleShot(500, self.close)
+        QTimer.singleShot(500, self, self.close)
 
     def _open_registration(self):
         """Open the face registration dialog."""
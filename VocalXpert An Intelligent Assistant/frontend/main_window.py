@@ -23,6 +23,7 @@ from .themes import (
     SPACING,
     RADIUS,
     get_theme,
+    set_theme,
     generate_stylesheet,
 )
 import sys
@@ -47,7 +48,8 @@ from PySide6.QtWidgets import (
     QSplashScreen,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, QTimer, QSize, Signal, QObject
+from PySide6.QtCore import (Qt, QTimer, QSize, Signal, QObject,
+                            QDeadlineTimer)
 from PySide6.QtGui import QFont, QPixmap, QIcon
 
 # Try to import speech recognition libraries
@@ -169,11 +171,7 @@ class Sidebar(QFrame):
     def _on_nav_click(self, key: str):
         """Handle navigation click."""
         logger.info(f"Sidebar clicked: {key}")
-        if self._active_button:
-            self._active_button.set_active(False)
-
-        self.nav_buttons[key].set_active(True)
-        self._active_button = self.nav_buttons[key]
+        self.set_active(key)
 
         # Call navigation callback
         if self.navigate_callback:
@@ -181,12 +179,18 @@ class Sidebar(QFrame):
 
     def set_active(self, key: str):
         """Set active navigation item programmatically."""
+        button = self.nav_buttons.get(key)
+        if button is self._active_button:
+            return
+
+        # Restyle both buttons in a single repaint
+        self.setUpdatesEnabled(False)
         if self._active_button:
             self._active_button.set_active(False)
-
-        if key in self.nav_buttons:
-            self.nav_buttons[key].set_active(True)
-            self._active_button = self.nav_buttons[key]
+        if button:
+            button.set_active(True)
+            self._active_button = button
+        self.setUpdatesEnabled(True)
 
     def update_theme(self, theme):
         """Update sidebar theme."""
@@ -209,6 +213,9 @@ class MainWindow(QMainWindow):
         self._current_theme = DARK_THEME
         self._voice_mode_active = False  # Changed from _voice_active
         self._continuous_voice_worker = None
+        # Command workers still running; holding them here keeps a
+        # QThread from being collected while a newer command starts.
+        self._command_workers = set()
         self._settings = {}
 
         self._setup_window()
@@ -317,7 +324,7 @@ class MainWindow(QMainWindow):
 
     def _apply_theme(self, theme):
         """Apply theme to application."""
-        self._current_theme = theme
+        self._current_theme = set_theme(theme)
         stylesheet = generate_stylesheet(theme)
         self.setStyleSheet(stylesheet)
         self.sidebar.update_theme(theme)
@@ -345,13 +352,16 @@ class MainWindow(QMainWindow):
 
         # Create worker thread
         settings = self.settings_panel.get_settings()
-        self._command_worker = CommandWorker(command, settings)
-        self._command_worker.status_changed.connect(
+        worker = CommandWorker(command, settings)
+        worker.status_changed.connect(
             lambda s: self.chat_panel.set_status("processing", s))
-        self._command_worker.result_ready.connect(self._on_command_result)
-        self._command_worker.open_game.connect(self._on_open_game)
-        self._command_worker.error_occurred.connect(self._on_command_error)
-        self._command_worker.start()
+        worker.result_ready.connect(self._on_command_result)
+        worker.open_game.connect(self._on_open_game)
+        worker.error_occurred.connect(self._on_command_error)
+        worker.finished.connect(
+            lambda: self._command_workers.discard(worker))
+        self._command_workers.add(worker)
+        worker.start()
 
     def _on_command_result(self, response: str, action_type: str):
         """Handle command result."""
@@ -538,59 +548,59 @@ class MainWindow(QMainWindow):
             if (hasattr(self, "_continuous_voice_worker") and
                     self._continuous_voice_worker):
                 logger.info("Stopping continuous voice worker...")
+                # Blocks until its recognition thread has stopped
                 self._continuous_voice_worker.stop_listening()
-                # Give it a moment to stop its current thread
-                QTimer.singleShot(200, self._cleanup_individual_threads)
+                self._continuous_voice_worker = None
 
         except Exception as e:
             logger.error(f"Error stopping continuous voice worker: {e}")
-            self._cleanup_individual_threads()
+
+        self._cleanup_individual_threads()
 
     def _cleanup_individual_threads(self):
         """Clean up individual worker threads."""
         try:
-            # Stop TTS worker
+            # Ask every worker to stop before waiting on any of them, so
+            # shutdown takes as long as the slowest worker rather than the
+            # sum of all of them. Each wait deadline starts counting now.
+            stopping = []
+
             if hasattr(self, "_tts_worker") and self._tts_worker:
                 logger.info("Stopping TTS worker...")
                 if self._tts_worker.isRunning():
                     self._tts_worker.stop()
-                    if not self._tts_worker.wait(3000):  # Wait up to 3 seconds
-                        logger.warning(
-                            "TTS worker didn't stop gracefully, terminating...")
-                        self._tts_worker.terminate()
-                        self._tts_worker.wait(1000)
+                    stopping.append(
+                        ("TTS", self._tts_worker, QDeadlineTimer(3000)))
                 self._tts_worker = None
 
-            # Stop command worker
-            if hasattr(self, "_command_worker") and self._command_worker:
+            # CommandWorker doesn't have a stop method and runs no event
+            # loop, so just terminate it
+            terminated = []
+            for worker in list(self._command_workers):
                 logger.info("Stopping command worker...")
-                if self._command_worker.isRunning():
-                    # CommandWorker doesn't have a stop method, so just
-                    # terminate
-                    self._command_worker.terminate()
-                    if not self._command_worker.wait(2000):
-                        logger.warning(
-                            "Command worker didn't terminate gracefully")
-                self._command_worker = None
-
-            # Force cleanup of any remaining threads by processing events
-            QTimer.singleShot(100, self._force_thread_cleanup)
+                if worker.isRunning():
+                    worker.terminate()
+                    terminated.append((worker, QDeadlineTimer(2000)))
+            self._command_workers.clear()
+
+            for name, worker, deadline in stopping:
+                if not worker.wait(deadline):
+                    logger.warning(
+                        f"{name} worker didn't stop gracefully, "
+                        "terminating...")
+                    worker.terminate()
+                    worker.wait(1000)
+
+            for worker, deadline in terminated:
+                if not worker.wait(deadline):
+                    logger.warning(
+                        "Command worker didn't terminate gracefully")
+
             logger.info("All threads cleaned up successfully")
 
         except Exception as e:
             logger.error(f"Error during thread cleanup: {e}")
 
-    def _force_thread_cleanup(self):
-        """Force cleanup of any remaining threads."""
-        try:
-            # Process any pending events to ensure thread cleanup
-            app = QApplication.instance()
-            if app:
-                app.processEvents()
-            logger.info("Forced thread cleanup completed")
-        except Exception as e:
-            logger.error(f"Error during forced cleanup: {e}")
-
 
 def create_splash_screen(app: QApplication) -> QSplashScreen:
     """Create and show splash screen."""
@@ -646,7 +656,7 @@ def main():
         splash.finish(window)
         window.show()
 
-    QTimer.singleShot(1500, show_main)
+    QTimer.singleShot(1500, window, show_main)
 
     logger.info("VocalXpert started")
 
@@ -4,6 +4,8 @@ Settings Panel - Application configuration
 User preferences, theme selection, voice settings, and more.
 """
 
+from typing import Tuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -18,11 +20,64 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, Slot
 
 from .components import Card, AnimatedToggle, SectionHeader
-from .themes import FONTS, SPACING, get_theme
+from .themes import FONTS, SPACING, get_font
+
+
+# Values the controls start with; kept up to date from the controls' change
+# signals once the sections have been built
+_DEFAULT_SETTINGS = {
+    "dark_mode": True,
+    "voice_input": True,
+    "voice_output": True,
+    "speech_rate": 175,
+    "ai_enabled": True,
+    "api_key": "",
+    "web_scraping_enabled": True,
+}
+
+
+def _make_section(title: str,
+                  spacing: int = SPACING["lg"]) -> Tuple[Card, QVBoxLayout]:
+    """Create a settings card with its title; returns (card, layout)."""
+    card = Card()
+    layout = QVBoxLayout(card)
+    layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
+                              SPACING["lg"])
+    layout.setSpacing(spacing)
+
+    # Section title
+    title_label = QLabel(title)
+    title_label.setFont(get_font(FONTS["size_lg"], FONTS["weight_semibold"]))
+    layout.addWidget(title_label)
+
+    return card, layout
+
+
+def _add_setting_row(layout: QVBoxLayout, title: str, description: str,
+                     *controls: QWidget):
+    """Add a label/description row with controls on the right to layout."""
+    # A nested layout would inherit the section's wide spacing
+    row = QHBoxLayout()
+    row.setSpacing(SPACING["sm"])
+
+    label = QLabel(title)
+    desc = QLabel(description)
+    desc.setProperty("class", "muted")
+
+    text = QVBoxLayout()
+    text.setSpacing(2)
+    text.addWidget(label)
+    text.addWidget(desc)
+
+    row.addLayout(text)
+    row.addStretch()
+    for control in controls:
+        row.addWidget(control)
+
+    layout.addLayout(row)
 
 
 class SettingsPanel(QWidget):
@@ -36,6 +91,10 @@ class SettingsPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # The sections are only built the first time the panel is shown;
+        # until then settings live in this dict
+        self._settings = dict(_DEFAULT_SETTINGS)
+        self._sections_built = False
         self._setup_ui()
 
     def _setup_ui(self):
@@ -57,27 +116,9 @@ class SettingsPanel(QWidget):
         header = self._create_header()
         layout.addWidget(header)
 
-        # Appearance settings
-        appearance = self._create_appearance_section()
-        layout.addWidget(appearance)
-
-        # Voice settings
-        voice = self._create_voice_section()
-        layout.addWidget(voice)
-
-        # AI settings
-        ai_settings = self._create_ai_section()
-        layout.addWidget(ai_settings)
-
-        # Web scraping settings
-        web_settings = self._create_web_section()
-        layout.addWidget(web_settings)
-
-        # About section
-        about = self._create_about_section()
-        layout.addWidget(about)
-
+        # Sections are inserted above the stretch by _build_sections()
         layout.addStretch()
+        self._content_layout = layout
 
         scroll.setWidget(content)
 
@@ -86,17 +127,34 @@ class SettingsPanel(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
 
+    def _build_sections(self):
+        """Create the settings sections below the header."""
+        self._sections_built = True
+        layout = self._content_layout
+        sections = (
+            self._create_appearance_section(),
+            self._create_voice_section(),
+            self._create_ai_section(),
+            self._create_web_section(),
+            self._create_about_section(),
+        )
+        for section in sections:
+            layout.insertWidget(layout.count() - 1, section)
+
+    def showEvent(self, event):
+        if not self._sections_built:
+            self._build_sections()
+        super().showEvent(event)
+
     def _create_header(self) -> QWidget:
         """Create settings header."""
         header = QFrame()
-        theme = get_theme()
 
         layout = QVBoxLayout(header)
         layout.setContentsMargins(0, 0, 0, SPACING["lg"])
 
         title = QLabel("⚙️ Settings")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_2xl"], FONTS["weight_bold"]))
+        title.setFont(get_font(FONTS["size_2xl"], FONTS["weight_bold"]))
 
         subtitle = QLabel("Customize your VocalXpert experience")
         subtitle.setProperty("class", "muted")
@@ -108,205 +166,78 @@ class SettingsPanel(QWidget):
 
     def _create_appearance_section(self) -> Card:
         """Create appearance settings section."""
-        card = Card()
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
-                                  SPACING["lg"])
-        layout.setSpacing(SPACING["lg"])
-
-        # Section title
-        title = QLabel("🎨 Appearance")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
-        layout.addWidget(title)
+        card, layout = _make_section("🎨 Appearance")
 
         # Theme toggle
-        theme_row = QWidget()
-        theme_layout = QHBoxLayout(theme_row)
-        theme_layout.setContentsMargins(0, 0, 0, 0)
-
-        theme_label = QLabel("Dark Mode")
-        theme_desc = QLabel("Switch between light and dark theme")
-        theme_desc.setProperty("class", "muted")
-
-        theme_text = QVBoxLayout()
-        theme_text.setSpacing(2)
-        theme_text.addWidget(theme_label)
-        theme_text.addWidget(theme_desc)
-
         self.dark_mode_toggle = AnimatedToggle()
-        self.dark_mode_toggle.setChecked(True)  # Default to dark
-        self.dark_mode_toggle.toggled.connect(
-            lambda checked: self.theme_changed.emit("dark"
-                                                    if checked else "light"))
-
-        theme_layout.addLayout(theme_text)
-        theme_layout.addStretch()
-        theme_layout.addWidget(self.dark_mode_toggle)
-
-        layout.addWidget(theme_row)
+        self.dark_mode_toggle.setChecked(self._settings["dark_mode"])
+        self.dark_mode_toggle.toggled.connect(self._on_dark_mode_toggled)
+        _add_setting_row(layout, "Dark Mode",
+                         "Switch between light and dark theme",
+                         self.dark_mode_toggle)
 
         # Accent color (future feature)
-        accent_row = QWidget()
-        accent_layout = QHBoxLayout(accent_row)
-        accent_layout.setContentsMargins(0, 0, 0, 0)
-
-        accent_label = QLabel("Accent Color")
-        accent_desc = QLabel("Primary color for buttons and highlights")
-        accent_desc.setProperty("class", "muted")
-
-        accent_text = QVBoxLayout()
-        accent_text.setSpacing(2)
-        accent_text.addWidget(accent_label)
-        accent_text.addWidget(accent_desc)
-
         self.accent_combo = QComboBox()
         self.accent_combo.addItems(
             ["Indigo", "Purple", "Blue", "Green", "Pink"])
         self.accent_combo.setFixedWidth(120)
-
-        accent_layout.addLayout(accent_text)
-        accent_layout.addStretch()
-        accent_layout.addWidget(self.accent_combo)
-
-        layout.addWidget(accent_row)
+        _add_setting_row(layout, "Accent Color",
+                         "Primary color for buttons and highlights",
+                         self.accent_combo)
 
         return card
 
     def _create_voice_section(self) -> Card:
         """Create voice settings section."""
-        card = Card()
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
-                                  SPACING["lg"])
-        layout.setSpacing(SPACING["lg"])
-
-        # Section title
-        title = QLabel("🎤 Voice Settings")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
-        layout.addWidget(title)
+        card, layout = _make_section("🎤 Voice Settings")
 
         # Voice enabled toggle
-        voice_row = QWidget()
-        voice_layout = QHBoxLayout(voice_row)
-        voice_layout.setContentsMargins(0, 0, 0, 0)
-
-        voice_label = QLabel("Voice Input")
-        voice_desc = QLabel("Enable microphone input for commands")
-        voice_desc.setProperty("class", "muted")
-
-        voice_text = QVBoxLayout()
-        voice_text.setSpacing(2)
-        voice_text.addWidget(voice_label)
-        voice_text.addWidget(voice_desc)
-
         self.voice_toggle = AnimatedToggle()
-        self.voice_toggle.setChecked(True)
-
-        voice_layout.addLayout(voice_text)
-        voice_layout.addStretch()
-        voice_layout.addWidget(self.voice_toggle)
-
-        layout.addWidget(voice_row)
+        self.voice_toggle.setChecked(self._settings["voice_input"])
+        self.voice_toggle.setProperty("setting_key", "voice_input")
+        self.voice_toggle.toggled.connect(self._on_toggle_changed)
+        _add_setting_row(layout, "Voice Input",
+                         "Enable microphone input for commands",
+                         self.voice_toggle)
 
         # Speech rate
-        rate_row = QWidget()
-        rate_layout = QHBoxLayout(rate_row)
-        rate_layout.setContentsMargins(0, 0, 0, 0)
-
-        rate_label = QLabel("Speech Rate")
-        rate_desc = QLabel("How fast the assistant speaks")
-        rate_desc.setProperty("class", "muted")
-
-        rate_text = QVBoxLayout()
-        rate_text.setSpacing(2)
-        rate_text.addWidget(rate_label)
-        rate_text.addWidget(rate_desc)
-
         self.rate_slider = QSlider(Qt.Horizontal)
         self.rate_slider.setRange(100, 250)
-        self.rate_slider.setValue(175)
+        self.rate_slider.setValue(self._settings["speech_rate"])
         self.rate_slider.setFixedWidth(150)
 
-        self.rate_value = QLabel("175")
+        self.rate_value = QLabel(str(self.rate_slider.value()))
         self.rate_value.setFixedWidth(40)
-        self.rate_slider.valueChanged.connect(
-            lambda v: self.rate_value.setText(str(v)))
-
-        rate_layout.addLayout(rate_text)
-        rate_layout.addStretch()
-        rate_layout.addWidget(self.rate_slider)
-        rate_layout.addWidget(self.rate_value)
-
-        layout.addWidget(rate_row)
+        self.rate_slider.valueChanged.connect(self._on_rate_changed)
+        _add_setting_row(layout, "Speech Rate",
+                         "How fast the assistant speaks", self.rate_slider,
+                         self.rate_value)
 
         # Voice output toggle
-        tts_row = QWidget()
-        tts_layout = QHBoxLayout(tts_row)
-        tts_layout.setContentsMargins(0, 0, 0, 0)
-
-        tts_label = QLabel("Voice Output")
-        tts_desc = QLabel("Speak responses aloud")
-        tts_desc.setProperty("class", "muted")
-
-        tts_text = QVBoxLayout()
-        tts_text.setSpacing(2)
-        tts_text.addWidget(tts_label)
-        tts_text.addWidget(tts_desc)
-
         self.tts_toggle = AnimatedToggle()
-        self.tts_toggle.setChecked(True)
-
-        tts_layout.addLayout(tts_text)
-        tts_layout.addStretch()
-        tts_layout.addWidget(self.tts_toggle)
-
-        layout.addWidget(tts_row)
+        self.tts_toggle.setChecked(self._settings["voice_output"])
+        self.tts_toggle.setProperty("setting_key", "voice_output")
+        self.tts_toggle.toggled.connect(self._on_toggle_changed)
+        _add_setting_row(layout, "Voice Output", "Speak responses aloud",
+                         self.tts_toggle)
 
         return card
 
     def _create_ai_section(self) -> Card:
         """Create AI settings section."""
-        card = Card()
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
-                                  SPACING["lg"])
-        layout.setSpacing(SPACING["lg"])
-
-        # Section title
-        title = QLabel("🤖 AI Settings")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
-        layout.addWidget(title)
+        card, layout = _make_section("🤖 AI Settings")
 
         # AI enabled
-        ai_row = QWidget()
-        ai_layout = QHBoxLayout(ai_row)
-        ai_layout.setContentsMargins(0, 0, 0, 0)
-
-        ai_label = QLabel("AI Responses")
-        ai_desc = QLabel("Use Groq AI for intelligent responses")
-        ai_desc.setProperty("class", "muted")
-
-        ai_text = QVBoxLayout()
-        ai_text.setSpacing(2)
-        ai_text.addWidget(ai_label)
-        ai_text.addWidget(ai_desc)
-
         self.ai_toggle = AnimatedToggle()
-        self.ai_toggle.setChecked(True)
-
-        ai_layout.addLayout(ai_text)
-        ai_layout.addStretch()
-        ai_layout.addWidget(self.ai_toggle)
-
-        layout.addWidget(ai_row)
+        self.ai_toggle.setChecked(self._settings["ai_enabled"])
+        self.ai_toggle.setProperty("setting_key", "ai_enabled")
+        self.ai_toggle.toggled.connect(self._on_toggle_changed)
+        _add_setting_row(layout, "AI Responses",
+                         "Use Groq AI for intelligent responses",
+                         self.ai_toggle)
 
         # API Key input
-        api_row = QWidget()
-        api_layout = QVBoxLayout(api_row)
-        api_layout.setContentsMargins(0, 0, 0, 0)
+        api_layout = QVBoxLayout()
         api_layout.setSpacing(SPACING["sm"])
 
         api_label = QLabel("Groq API Key")
@@ -316,102 +247,108 @@ class SettingsPanel(QWidget):
         self.api_input = QLineEdit()
         self.api_input.setPlaceholderText("gsk_...")
         self.api_input.setEchoMode(QLineEdit.Password)
+        self.api_input.setText(self._settings["api_key"])
+        self.api_input.textChanged.connect(self._on_api_key_changed)
 
         api_layout.addWidget(api_label)
         api_layout.addWidget(api_desc)
         api_layout.addWidget(self.api_input)
 
-        layout.addWidget(api_row)
+        layout.addLayout(api_layout)
 
         return card
 
     def _create_web_section(self) -> Card:
         """Create web scraping settings section."""
-        card = Card()
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
-                                  SPACING["lg"])
-        layout.setSpacing(SPACING["lg"])
-
-        # Section title
-        title = QLabel("🌐 Web Features")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
-        layout.addWidget(title)
+        card, layout = _make_section("🌐 Web Features")
 
         # Web scraping mode toggle
-        web_row = QWidget()
-        web_layout = QHBoxLayout(web_row)
-        web_layout.setContentsMargins(0, 0, 0, 0)
-
-        web_label = QLabel("Web Scraping Mode")
-        web_desc = QLabel(
-            "Enable advanced web features (Wikipedia, weather, news, YouTube, etc.)"
-        )
-        web_desc.setProperty("class", "muted")
-
-        web_text = QVBoxLayout()
-        web_text.setSpacing(2)
-        web_text.addWidget(web_label)
-        web_text.addWidget(web_desc)
-
         self.web_scraping_toggle = AnimatedToggle()
-        self.web_scraping_toggle.setChecked(True)  # Default to enabled
-
-        web_layout.addLayout(web_text)
-        web_layout.addStretch()
-        web_layout.addWidget(self.web_scraping_toggle)
-
-        layout.addWidget(web_row)
+        self.web_scraping_toggle.setChecked(
+            self._settings["web_scraping_enabled"])
+        self.web_scraping_toggle.setProperty("setting_key",
+                                             "web_scraping_enabled")
+        self.web_scraping_toggle.toggled.connect(self._on_toggle_changed)
+        _add_setting_row(
+            layout, "Web Scraping Mode",
+            "Enable advanced web features (Wikipedia, weather, news, YouTube, etc.)",
+            self.web_scraping_toggle)
 
         return card
 
     def _create_about_section(self) -> Card:
         """Create about section."""
-        card = Card()
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(SPACING["lg"], SPACING["lg"], SPACING["lg"],
-                                  SPACING["lg"])
-        layout.setSpacing(SPACING["md"])
-
-        # Section title
-        title = QLabel("ℹ️ About")
-        title.setFont(
-            QFont(FONTS["family"], FONTS["size_lg"], FONTS["weight_semibold"]))
-        layout.addWidget(title)
-
-        # App info
-        info = QLabel("<b>VocalXpert</b> v2.0.0<br><br>"
-                      "An intelligent AI voice assistant.<br><br>"
-                      "<b>Created by:</b><br>"
-                      "• Ghulam Murtaza<br>"
-                      "• Capt. Asim Iqbal<br>"
-                      "• Capt. Bilal Zaib<br>"
-                      "• Huzaifa Kahut<br><br>"
-                      "<b>Technologies:</b><br>"
-                      "Python, PySide6, Groq AI, SpeechRecognition")
-        info.setProperty("class", "muted")
-        info.setWordWrap(True)
-        info.setOpenExternalLinks(True)
-
-        layout.addWidget(info)
+        card, layout = _make_section("ℹ️ About", SPACING["md"])
+
+        # App info, as plain-text labels so no rich-text document is built
+        about = (
+            ("VocalXpert v2.0.0", "An intelligent AI voice assistant."),
+            ("Created by:", "• Ghulam Murtaza\n"
+             "• Capt. Asim Iqbal\n"
+             "• Capt. Bilal Zaib\n"
+             "• Huzaifa Kahut"),
+            ("Technologies:", "Python, PySide6, Groq AI, SpeechRecognition"),
+        )
+        for heading, body in about:
+            group = QVBoxLayout()
+            group.setSpacing(2)
+            for text, weight in ((heading, FONTS["weight_bold"]),
+                                 (body, FONTS["weight_normal"])):
+                label = QLabel(text)
+                label.setTextFormat(Qt.PlainText)
+                label.setFont(get_font(FONTS["size_md"], weight))
+                label.setProperty("class", "muted")
+                label.setWordWrap(True)
+                group.addWidget(label)
+            layout.addLayout(group)
 
         return card
 
+    @Slot(bool)
+    def _on_dark_mode_toggled(self, checked: bool):
+        """Emit the theme name for the dark mode toggle state."""
+        self._store_setting("dark_mode", checked)
+        self.theme_changed.emit("dark" if checked else "light")
+
+    @Slot(int)
+    def _on_rate_changed(self, value: int):
+        """Record the speech rate and show it next to the slider."""
+        self.rate_value.setText(str(value))
+        self._store_setting("speech_rate", value)
+
+    @Slot(bool)
+    def _on_toggle_changed(self, checked: bool):
+        """Record the state of the toggle that changed."""
+        self._store_setting(self.sender().property("setting_key"), checked)
+
+    @Slot(str)
+    def _on_api_key_changed(self, text: str):
+        """Record the edited API key."""
+        self._store_setting("api_key", text)
+
+    def _store_setting(self, key: str, value):
+        """Record a control's new value and announce the change."""
+        self._settings[key] = value
+        self.setting_changed.emit(key, value)
+
     def get_settings(self) -> dict:
         """Get all current settings."""
-        return {
-            "dark_mode": self.dark_mode_toggle.isChecked(),
-            "voice_input": self.voice_toggle.isChecked(),
-            "voice_output": self.tts_toggle.isChecked(),
-            "speech_rate": self.rate_slider.value(),
-            "ai_enabled": self.ai_toggle.isChecked(),
-            "api_key": self.api_input.text(),
-            "web_scraping_enabled": self.web_scraping_toggle.isChecked(),
-        }
+        # A copy, since the result is handed to worker threads
+        return dict(self._settings)
 
     def load_settings(self, settings: dict):
         """Load settings from dict."""
+        if not self._sections_built:
+            # Applied to the controls when they are created
+            if ("dark_mode" in settings and
+                    settings["dark_mode"] != self._settings["dark_mode"]):
+                self.theme_changed.emit(
+                    "dark" if settings["dark_mode"] else "light")
+            self._settings.update((key, settings[key])
+                                  for key in _DEFAULT_SETTINGS
+                                  if key in settings)
+            return
+
         if "dark_mode" in settings:
             self.dark_mode_toggle.setChecked(settings["dark_mode"])
         if "voice_input" in settings:
@@ -6,12 +6,19 @@ Supports dark/light mode with smooth transitions.
 """
 
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional, Union
 
+from PySide6.QtGui import QFont
 
-@dataclass
+
+@dataclass(frozen=True)
 class Theme:
-    """Theme configuration container."""
+    """Theme configuration container.
+
+    Themes are immutable (and so hashable), which lets generated
+    stylesheets be cached per theme.
+    """
 
     name: str
 
@@ -183,13 +190,59 @@ SPACING = {
 }
 
 
-def get_theme(theme_name: str = "dark") -> Theme:
-    """Get theme by name."""
+THEMES: Dict[str, Theme] = {
+    "dark": DARK_THEME,
+    "light": LIGHT_THEME,
+}
+
+# The theme currently applied to the UI, and a counter bumped on every
+# switch so painted widgets can tell when their cached colors are stale
+_ACTIVE_THEME: Theme = DARK_THEME
+_THEME_VERSION = 0
+
+
+def get_theme(theme_name: Optional[str] = None) -> Theme:
+    """Get theme by name, or the active theme when no name is given."""
+    if theme_name is None:
+        return _ACTIVE_THEME
     return DARK_THEME if theme_name == "dark" else LIGHT_THEME
 
 
+def set_theme(theme: Union[str, Theme]) -> Theme:
+    """Make a theme (or theme name) the active one and return it."""
+    global _ACTIVE_THEME, _THEME_VERSION
+
+    if isinstance(theme, str):
+        theme = get_theme(theme)
+    if theme is not _ACTIVE_THEME:
+        _ACTIVE_THEME = theme
+        _THEME_VERSION += 1
+    return theme
+
+
+def theme_version() -> int:
+    """Get the number of theme switches so far."""
+    return _THEME_VERSION
+
+
+@lru_cache(maxsize=64)
+def get_font(size: int, weight: int = -1) -> QFont:
+    """Get the shared app-family font for a size and weight.
+
+    Sizes are in pixels, like the font sizes in the stylesheet. The
+    returned instance is cached; setFont() copies it, so callers must not
+    modify it in place.
+    """
+    font = QFont(FONTS["family"])
+    font.setPixelSize(size)
+    if weight >= 0:
+        font.setWeight(QFont.Weight(weight))
+    return font
+
+
+@lru_cache(maxsize=4)
 def generate_stylesheet(theme: Theme) -> str:
-    """Generate complete QSS stylesheet for the theme."""
+    """Generate complete QSS stylesheet for the theme (cached per theme)."""
     return f"""
     /* ============================================= */
     /* VocalXpert Modern Theme - {theme.name.upper()} */
@@ -553,17 +606,172 @@ def generate_stylesheet(theme: Theme) -> str:
         font-weight: {FONTS['weight_semibold']};
     }}
 
-    /* Chat Message Bubble */
-    QWidget[class="message-user"] {{
-        background-color: {theme.chat_user_bg};
-        border-radius: {RADIUS['lg']}px;
-        border-bottom-right-radius: {RADIUS['sm']}px;
+    /* Chat Panel */
+    QFrame#chatHeader {{
+        background-color: {theme.bg_secondary};
+        border-bottom: 1px solid {theme.border};
     }}
 
-    QWidget[class="message-bot"] {{
-        background-color: {theme.chat_bot_bg};
-        border-radius: {RADIUS['lg']}px;
-        border-bottom-left-radius: {RADIUS['sm']}px;
+    QWidget#quickActions {{
+        background-color: {theme.bg_primary};
+    }}
+
+    QWidget#inputArea {{
+        background-color: {theme.bg_secondary};
+        border-top: 1px solid {theme.border};
+    }}
+
+    QWidget#inputArea > QWidget {{
+        background-color: transparent;
+    }}
+
+    QLabel[class="system-prompt"] {{
+        color: {theme.text_muted};
+        font-family: {FONTS['family_mono']};
+        font-size: 10px;
+    }}
+
+    /* History Panel */
+    QFrame#historyHeader, QFrame#historyStatsBar {{
+        background-color: {theme.bg_secondary};
+        border-bottom: 1px solid {theme.border};
+    }}
+
+    QLabel#historyTitle {{
+        color: {theme.text_primary};
+        font-size: 24px;
+        font-weight: 700;
+    }}
+
+    QLabel#historySubtitle {{
+        color: {theme.text_muted};
+        font-size: 13px;
+    }}
+
+    QPushButton#historyExportButton {{
+        background-color: {theme.bg_tertiary};
+        color: {theme.text_secondary};
+        border: 1px solid {theme.border};
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 600;
+    }}
+
+    QPushButton#historyExportButton:hover {{
+        background-color: {theme.bg_input};
+        border-color: {theme.primary}50;
+    }}
+
+    QPushButton#historyRefreshButton {{
+        background-color: {theme.primary};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 20px;
+        font-size: 12px;
+        font-weight: 600;
+    }}
+
+    QPushButton#historyRefreshButton:hover {{
+        background-color: {theme.primary_hover};
+    }}
+
+    QLineEdit#historySearch {{
+        background-color: {theme.bg_input};
+        border: 1px solid {theme.border};
+        border-radius: 10px;
+        padding: 10px 16px;
+        font-size: 13px;
+        color: {theme.text_primary};
+    }}
+
+    QLineEdit#historySearch:focus {{
+        border-color: {theme.primary};
+    }}
+
+    QComboBox[class="history-filter"] {{
+        background-color: {theme.bg_input};
+        border: 1px solid {theme.border};
+        border-radius: 10px;
+        padding: 10px 16px;
+        font-size: 13px;
+        color: {theme.text_primary};
+        min-width: 130px;
+    }}
+
+    QComboBox[class="history-filter"]:focus {{
+        border-color: {theme.primary};
+    }}
+
+    QComboBox[class="history-filter"]::drop-down {{
+        border: none;
+        padding-right: 10px;
+    }}
+
+    QComboBox[class="history-filter"] QAbstractItemView {{
+        background-color: {theme.bg_card};
+        border: 1px solid {theme.border};
+        border-radius: 8px;
+        selection-background-color: {theme.primary}30;
+        color: {theme.text_primary};
+    }}
+
+    QFrame#historyListPanel {{
+        background-color: {theme.bg_secondary};
+        border: 1px solid {theme.border};
+        border-radius: 16px;
+    }}
+
+    QLabel#historyListTitle {{
+        color: {theme.text_primary};
+        font-size: 14px;
+        font-weight: 600;
+    }}
+
+    QLabel#historyCountBadge {{
+        background-color: {theme.primary}20;
+        color: {theme.primary};
+        padding: 2px 10px;
+        border: 1px solid transparent;
+        border-radius: 10px;
+        font-size: 12px;
+        font-weight: 600;
+    }}
+
+    QListView#historyList {{
+        border: none;
+        background-color: transparent;
+        outline: none;
+    }}
+
+    QListView#historyList QScrollBar:vertical {{
+        background-color: {theme.bg_tertiary};
+        width: 8px;
+        border-radius: 4px;
+    }}
+
+    QListView#historyList QScrollBar::handle:vertical {{
+        background-color: {theme.border_light};
+        border-radius: 4px;
+        min-height: 40px;
+    }}
+
+    QListView#historyList QScrollBar::handle:vertical:hover {{
+        background-color: {theme.primary};
+    }}
+
+    QLabel#historyEmptyIcon {{
+        font-size: 32px;
+    }}
+
+    QLabel#historyEmptyText, QLabel#historyEmptyHint {{
+        color: {theme.text_muted};
+        font-size: 13px;
+    }}
+
+    QLabel#historyEmptyHint {{
+        font-size: 11px;
     }}
 
     /* Card */
@@ -585,4 +793,25 @@ def generate_stylesheet(theme: Theme) -> str:
     QLabel[class="status-listening"] {{
         color: {theme.warning};
     }}
+
+    QLabel#statusDot[status="ready"] {{
+        color: {theme.success};
+    }}
+
+    QLabel#statusDot[status="listening"] {{
+        color: {theme.warning};
+    }}
+
+    QLabel#statusDot[status="processing"],
+    QLabel#statusDot[status="speaking"] {{
+        color: {theme.info};
+    }}
+
+    QLabel#statusDot[status="error"] {{
+        color: {theme.error};
+    }}
+
+    QLabel#statusDot[status="offline"] {{
+        color: {theme.text_muted};
+    }}
     """
@@ -1511,8 +1511,8 @@ class ContinuousVoiceWorker(QObject):
         if self._is_active:
             logger.info(
                 "ContinuousVoiceWorker: Restarting recognition after TTS")
-            QTimer.singleShot(500,
-                              self._start_recognition)  # Small delay after TTS
+            # Small delay after TTS
+            QTimer.singleShot(500, self, self._start_recognition)
 
     def _start_recognition(self):
         """Start a new recognition cycle."""
@@ -1561,7 +1561,7 @@ class ContinuousVoiceWorker(QObject):
             f"ContinuousVoiceWorker error: {error}, active={self._is_active}")
         # Restart for both timeout and empty (no speech detected) errors
         if self._is_active and error in ("timeout", "empty"):
-            QTimer.singleShot(500, self._start_recognition)
+            QTimer.singleShot(500, self, self._start_recognition)
 
     def _on_finished(self):
         """Handle recognition finished - restart if still active and not waiting for TTS."""
@@ -1569,4 +1569,4 @@ class ContinuousVoiceWorker(QObject):
             f"ContinuousVoiceWorker finished: active={self._is_active}, waiting_for_tts={self._waiting_for_tts}"
         )
         if self._is_active and not self._waiting_for_tts:
-            QTimer.singleShot(1000, self._start_recognition)
+            QTimer.singleShot(1000, self, self._start_recognition)
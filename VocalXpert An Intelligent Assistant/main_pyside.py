@@ -22,6 +22,7 @@ import sys
 import os
 import logging
 import argparse
+import importlib.util
 from pathlib import Path
 
 # Add project root to path
@@ -97,9 +98,9 @@ def check_dependencies():
     except ImportError:
         missing.append("pyttsx3")
 
-    try:
-        import cv2
-    except ImportError:
+    # Only check that OpenCV is installed; loading it is left to face
+    # registration, which imports it on demand
+    if importlib.util.find_spec("cv2") is None:
         missing.append("opencv-python")
 
     if missing:
@@ -158,7 +159,7 @@ def main():
 
         from PySide6.QtCore import QTimer
 
-        QTimer.singleShot(1500, show_main)
+        QTimer.singleShot(1500, window, show_main)
 
     else:
         # Always show login screen first
@@ -4,6 +4,7 @@ User Handler Module - User Profile Management
 Manages user data including name, gender, and avatar selection.
 """
 
+import json
 import pickle
 import os
 
@@ -26,29 +27,46 @@ class UserData:
         self.userphoto = 0
 
     def extractData(self):
-        """Load user data from pickle file."""
+        """Load user data from the JSON (or legacy pickle) file."""
         try:
             with open(_user_data_file, "rb") as file:
-                details = pickle.load(file)
-                self.name = details.get("name", "User")
-                self.gender = details.get("gender", "None")
-                self.userphoto = details.get("userphoto", 0)
+                raw = file.read()
+            try:
+                details = json.loads(raw)
+            except ValueError:
+                # Files written before the JSON format are pickles;
+                # rewrite them as JSON so they are only unpickled once
+                details = pickle.loads(raw)
+                if not isinstance(details, dict):
+                    raise ValueError("user data is not a dict")
+                self.updateData(details.get("name", "User"),
+                                details.get("gender", "None"),
+                                details.get("userphoto", 0))
+            self.name = details.get("name", "User")
+            self.gender = details.get("gender", "None")
+            self.userphoto = details.get("userphoto", 0)
         except FileNotFoundError:
             # Create default user data
             self.updateData("User", "None", 0)
+        except pickle.UnpicklingError as e:
+            print(f"Error loading user data: unreadable file ({e})")
         except Exception as e:
             print(f"Error loading user data: {e}")
 
     def updateData(self, name, gender, userphoto):
-        """Save user data to pickle file."""
+        """Save user data to JSON file."""
         try:
-            with open(_user_data_file, "wb") as file:
+            # Write a temporary file and swap it in so a crash mid-write
+            # cannot leave a torn profile behind
+            tmp_file = _user_data_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as file:
                 details = {
                     "name": name,
                     "gender": gender,
                     "userphoto": userphoto
                 }
-                pickle.dump(details, file)
+                json.dump(details, file, ensure_ascii=False)
+            os.replace(tmp_file, _user_data_file)
             self.name = name
             self.gender = gender
             self.userphoto = userphoto